@@ -251,7 +251,9 @@ int main(int argc, char* argv[]) {
     std::cout << "  Implementation: CPU (multi-threaded)\n\n";
   }
 
-  sdfgen::make_level_set3(faceList, vertList, min_box, dx, sizes[0], sizes[1], sizes[2], phi_grid, 1, backend, num_threads);
+  // The CLI keeps fast sweeping, so its output files do not change with the library default
+  sdfgen::make_level_set3(faceList, vertList, min_box, dx, sizes[0], sizes[1], sizes[2], phi_grid, 1, backend, num_threads,
+                          sdfgen::FarFieldMethod::Sweep);
 
   std::cout << "SDF computation complete.\n\n";
 
@@ -26,6 +26,23 @@ std::string get_extension(const std::string& filename) {
     return ext;
 }
 
+void compute_bounds(const float* xyz, size_t num_vertices, Vec3f& min_box, Vec3f& max_box) {
+    // Seed with the first vertex so no sentinel values are needed
+    float lo0 = xyz[0], lo1 = xyz[1], lo2 = xyz[2];
+    float hi0 = lo0, hi1 = lo1, hi2 = lo2;
+
+    // Single pass: keep the six running extrema in registers
+    for (size_t i = 1; i < num_vertices; ++i) {
+        const float* p = xyz + 3 * i;
+        lo0 = std::min(lo0, p[0]); hi0 = std::max(hi0, p[0]);
+        lo1 = std::min(lo1, p[1]); hi1 = std::max(hi1, p[1]);
+        lo2 = std::min(lo2, p[2]); hi2 = std::max(hi2, p[2]);
+    }
+
+    min_box = Vec3f(lo0, lo1, lo2);
+    max_box = Vec3f(hi0, hi1, hi2);
+}
+
 bool load_mesh(const char* filename,
                std::vector<Vec3f>& vertList,
                std::vector<Vec3ui>& faceList,
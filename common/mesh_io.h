@@ -107,6 +107,21 @@ inline void update_minmax(const Vec3f& point, Vec3f& min_box, Vec3f& max_box) {
     max_box[2] = std::max(max_box[2], point[2]);
 }
 
+/**
+ * @brief Compute axis-aligned bounding box of a packed vertex buffer
+ *
+ * Streams the vertex positions once, tracking the per-axis minimum and maximum in
+ * local accumulators. The buffer is interpreted as num_vertices consecutive (x, y, z)
+ * float triples, which matches both std::vector<Vec3f> storage and a C-contiguous
+ * (N, 3) float32 NumPy array, so callers can pass either without copying.
+ *
+ * @param xyz Pointer to 3 * num_vertices floats (x0, y0, z0, x1, y1, z1, ...)
+ * @param num_vertices Number of vertices in the buffer (must be > 0)
+ * @param min_box Output minimum corner of axis-aligned bounding box
+ * @param max_box Output maximum corner of axis-aligned bounding box
+ */
+void compute_bounds(const float* xyz, size_t num_vertices, Vec3f& min_box, Vec3f& max_box);
+
 /**
  * @brief Extract file extension from filename and convert to lowercase
  *
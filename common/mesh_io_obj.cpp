@@ -7,16 +7,52 @@
 
 #include "mesh_io.h"
 #include <fstream>
-#include <sstream>
 #include <iostream>
 #include <algorithm>
 #include <cctype>
+#include <charconv>
 #include <cstdint>
+#include <cstring>
+#include <limits>
+#include <string>
 
 namespace meshio {
 
-// Constants
-constexpr size_t LINE_BUFFER_SIZE = 256;  // Typical OBJ line length
+// Skip spaces and tabs, stopping at the end of the line
+static const char* skip_blanks(const char* p, const char* line_end) {
+    while (p < line_end && (*p == ' ' || *p == '\t')) ++p;
+    return p;
+}
+
+// Parse a number with std::from_chars, which unlike strtof/strtol ignores the
+// C locale (a comma decimal separator would otherwise truncate coordinates).
+// Returns the end of the number, or nullptr if there is none.
+template <typename T>
+static const char* parse_number(const char* p, const char* line_end, T& value) {
+    if (p < line_end && *p == '+') ++p;  // from_chars does not take a plus sign
+    std::from_chars_result result = std::from_chars(p, line_end, value);
+    return result.ec == std::errc() ? result.ptr : nullptr;
+}
+
+// Read a whole file into memory; parsing the buffer in place avoids a stream
+// extraction and string copy per line
+static bool read_file(const char* filename, std::string& contents) {
+    std::ifstream infile(filename, std::ios::binary);
+    if (!infile) {
+        return false;
+    }
+
+    infile.seekg(0, std::ios::end);
+    std::streamoff size = infile.tellg();
+    infile.seekg(0, std::ios::beg);
+    if (size < 0) {
+        return false;
+    }
+
+    contents.resize(static_cast<size_t>(size));
+    infile.read(&contents[0], size);
+    return infile.gcount() == size;
+}
 
 bool load_obj(const char* filename,
               std::vector<Vec3f>& vertList,
@@ -24,9 +60,8 @@ bool load_obj(const char* filename,
               Vec3f& min_box,
               Vec3f& max_box) {
 
-    // RAII: ifstream automatically closes file on scope exit
-    std::ifstream infile(filename);
-    if (!infile) {
+    std::string contents;
+    if (!read_file(filename, contents)) {
         std::cerr << "ERROR: Failed to open OBJ file: " << filename << std::endl;
         return false;
     }
@@ -46,36 +81,50 @@ bool load_obj(const char* filename,
                     std::numeric_limits<float>::lowest());
 
     int32_t ignored_lines = 0;
-    std::string line;
-    line.reserve(LINE_BUFFER_SIZE);
-
-    while (std::getline(infile, line)) {
-        // Skip empty lines
-        if (line.empty()) {
+    std::vector<int64_t> vertices;
+
+    const char* p = contents.c_str();
+    const char* end = p + contents.size();
+
+    while (p < end) {
+        // memchr scans for the line end a word (or vector register) at a time
+        const char* line_end = static_cast<const char*>(std::memchr(p, '\n', end - p));
+        if (!line_end) line_end = end;
+        const char* line = p;
+        p = line_end + 1;
+
+        // Ignore the carriage return of CRLF files and skip empty lines
+        if (line_end > line && line_end[-1] == '\r') --line_end;
+        size_t length = static_cast<size_t>(line_end - line);
+        if (length == 0) {
             continue;
         }
 
         // Parse line based on first character(s)
         if (line[0] == 'v') {
-            if (line.size() >= 2 && line[1] == 'n') {
+            if (length >= 2 && line[1] == 'n') {
                 // Vertex normal - skip (not needed for SDF generation)
                 ++ignored_lines;
                 continue;
             }
-            else if (line.size() >= 2 && line[1] == 't') {
+            else if (length >= 2 && line[1] == 't') {
                 // Texture coordinate - skip
                 ++ignored_lines;
                 continue;
             }
-            else if (line[1] == ' ' || line[1] == '\t') {
+            else if (length >= 2 && (line[1] == ' ' || line[1] == '\t')) {
                 // Vertex position
-                std::istringstream data(line);
-                char c;
                 Vec3f point;
-                data >> c >> point[0] >> point[1] >> point[2];
+                const char* q = line + 1;
+                bool ok = true;
+                for (int axis = 0; axis < 3 && ok; ++axis) {
+                    q = parse_number(skip_blanks(q, line_end), line_end, point[axis]);
+                    ok = q != nullptr;
+                }
 
-                if (data.fail()) {
-                    std::cerr << "WARNING: Failed to parse vertex: " << line << std::endl;
+                if (!ok) {
+                    std::cerr << "WARNING: Failed to parse vertex: "
+                              << std::string(line, length) << std::endl;
                     continue;
                 }
 
@@ -83,30 +132,48 @@ bool load_obj(const char* filename,
                 update_minmax(point, min_box, max_box);
             }
         }
-        else if (line[0] == 'f' && (line[1] == ' ' || line[1] == '\t')) {
+        else if (line[0] == 'f' && length >= 2 && (line[1] == ' ' || line[1] == '\t')) {
             // Face - can be v, v/vt, v/vt/vn, or v//vn format
             // Can be triangles or quads
-            std::istringstream data(line);
-            char c;
-            data >> c; // Skip 'f'
-
-            std::vector<int32_t> vertices;
-            std::string vertex_str;
-
-            // Read all vertex entries
-            while (data >> vertex_str) {
-                // Parse v/vt/vn format - extract only vertex index
-                size_t first_slash = vertex_str.find('/');
-                std::string v_str = (first_slash != std::string::npos)
-                                   ? vertex_str.substr(0, first_slash)
-                                   : vertex_str;
-
-                int32_t v_idx = std::stoi(v_str);
+            vertices.clear();
+            bool ok = true;
+
+            // Read all vertex entries, keeping only the vertex index of each
+            const char* q = skip_blanks(line + 1, line_end);
+            while (q < line_end) {
+                int64_t v_idx = 0;
+                const char* next = parse_number(q, line_end, v_idx);
+                if (!next || v_idx == 0) {
+                    ok = false;
+                    break;
+                }
+
+                // Negative indices count back from the most recent vertex (-1 is the
+                // last one read so far), as in the OBJ spec
+                if (v_idx < 0) {
+                    v_idx += static_cast<int64_t>(vertList.size()) + 1;
+                    if (v_idx < 1) {
+                        ok = false;
+                        break;
+                    }
+                }
                 vertices.push_back(v_idx);
+
+                // Skip the rest of the entry (/vt/vn)
+                q = next;
+                while (q < line_end && *q != ' ' && *q != '\t') ++q;
+                q = skip_blanks(q, line_end);
+            }
+
+            if (!ok) {
+                std::cerr << "WARNING: Failed to parse face: "
+                          << std::string(line, length) << std::endl;
+                continue;
             }
 
             if (vertices.size() < 3) {
-                std::cerr << "WARNING: Face has < 3 vertices: " << line << std::endl;
+                std::cerr << "WARNING: Face has < 3 vertices: "
+                          << std::string(line, length) << std::endl;
                 continue;
             }
 
@@ -130,8 +197,6 @@ bool load_obj(const char* filename,
         }
     }
 
-    // RAII: infile automatically closed here
-
     // Validate results
     if (vertList.empty()) {
         std::cerr << "ERROR: No vertices found in OBJ file" << std::endl;
@@ -122,6 +122,29 @@ static bool load_binary_stl(const char* filename,
 
     std::cout << "Reading binary STL with " << num_triangles << " triangles..." << std::endl;
 
+    // A bad count must not turn into a huge allocation below
+    std::streamoff data_start = file.tellg();
+    file.seekg(0, std::ios::end);
+    std::streamoff data_size = file.tellg() - data_start;
+    file.seekg(data_start, std::ios::beg);
+
+    if (data_size < static_cast<std::streamoff>(num_triangles) * static_cast<std::streamoff>(STL_TRIANGLE_SIZE)) {
+        std::cerr << "ERROR: Failed to read triangle "
+                  << data_size / static_cast<std::streamoff>(STL_TRIANGLE_SIZE) << std::endl;
+        return false;
+    }
+
+    // Read all triangle records in one call; the records are then decoded from
+    // memory instead of three stream seeks and a read per triangle
+    std::vector<char> records(static_cast<size_t>(num_triangles) * STL_TRIANGLE_SIZE);
+    file.read(records.data(), static_cast<std::streamsize>(records.size()));
+
+    if (file.gcount() != static_cast<std::streamsize>(records.size())) {
+        std::cerr << "ERROR: Failed to read triangle "
+                  << file.gcount() / static_cast<std::streamsize>(STL_TRIANGLE_SIZE) << std::endl;
+        return false;
+    }
+
     // Clear and reserve space
     vertList.clear();
     faceList.clear();
@@ -136,22 +159,14 @@ static bool load_binary_stl(const char* filename,
                     std::numeric_limits<float>::lowest(),
                     std::numeric_limits<float>::lowest());
 
-    // Read triangles
+    // Decode triangles
     for (uint32_t i = 0; i < num_triangles; ++i) {
-        // Skip normal (STL_NORMAL_SIZE bytes = 3 floats)
-        file.seekg(STL_NORMAL_SIZE, std::ios::cur);
-
-        // Read 3 vertices (9 floats = STL_VERTEX_DATA_SIZE bytes)
+        // Skip normal (STL_NORMAL_SIZE bytes = 3 floats); the attribute bytes
+        // (STL_ATTRIBUTE_SIZE) follow the vertices and are never read.
+        // Records are 50 bytes, so the floats are unaligned and copied out.
         float v[9];
-        file.read(reinterpret_cast<char*>(v), STL_VERTEX_DATA_SIZE);
-
-        if (file.fail()) {
-            std::cerr << "ERROR: Failed to read triangle " << i << std::endl;
-            return false;
-        }
-
-        // Skip attribute bytes (STL_ATTRIBUTE_SIZE bytes)
-        file.seekg(STL_ATTRIBUTE_SIZE, std::ios::cur);
+        std::memcpy(v, records.data() + static_cast<size_t>(i) * STL_TRIANGLE_SIZE + STL_NORMAL_SIZE,
+                    STL_VERTEX_DATA_SIZE);
 
         // Store vertices and update bounds
         uint32_t idx_base = static_cast<uint32_t>(vertList.size());
@@ -0,0 +1,91 @@
+// SDFGen - Signed Distance Field Generator
+// Spatial reordering of mesh triangles and vertices implementation
+// Copyright (c) 2025 Brad Chamberlain
+// Licensed under the MIT License - see LICENSE file
+
+#include "mesh_reorder.h"
+#include <algorithm>
+#include <cstdint>
+#include <utility>
+
+namespace meshio {
+
+// Spread the low 10 bits of v so there are two zero bits between each
+static uint32_t expand_bits(uint32_t v) {
+    v = (v * 0x00010001u) & 0xFF0000FFu;
+    v = (v * 0x00000101u) & 0x0F00F00Fu;
+    v = (v * 0x00000011u) & 0xC30C30C3u;
+    v = (v * 0x00000005u) & 0x49249249u;
+    return v;
+}
+
+// Quantize t in [0, 1] to 10 bits
+static uint32_t quantize(float t) {
+    int q = (int)(t * 1023.0f);
+    return (uint32_t)std::min(std::max(q, 0), 1023);
+}
+
+void reorder_for_locality(std::vector<Vec3f>& vertices,
+                          std::vector<Vec3ui>& faces) {
+    if (faces.size() < 2) return;
+
+    // Centroids and their bounding box
+    std::vector<Vec3f> centroids(faces.size());
+    Vec3f cmin, cmax;
+    for (size_t t = 0; t < faces.size(); ++t) {
+        const Vec3ui& f = faces[t];
+        centroids[t] = (vertices[f[0]] + vertices[f[1]] + vertices[f[2]]) / 3.0f;
+        if (t == 0) {
+            cmin = cmax = centroids[t];
+        } else {
+            update_minmax(centroids[t], cmin, cmax);
+        }
+    }
+
+    Vec3f scale;
+    for (int a = 0; a < 3; ++a) {
+        float extent = cmax[a] - cmin[a];
+        scale[a] = extent > 0 ? 1.0f / extent : 0.0f;
+    }
+
+    // Sort triangles by Morton code, Z most significant
+    std::vector<std::pair<uint32_t, unsigned int>> keys(faces.size());
+    for (size_t t = 0; t < faces.size(); ++t) {
+        Vec3f c = centroids[t];
+        uint32_t x = quantize((c[0] - cmin[0]) * scale[0]);
+        uint32_t y = quantize((c[1] - cmin[1]) * scale[1]);
+        uint32_t z = quantize((c[2] - cmin[2]) * scale[2]);
+        uint32_t code = (expand_bits(z) << 2) | (expand_bits(y) << 1) | expand_bits(x);
+        keys[t] = std::make_pair(code, (unsigned int)t);
+    }
+    std::sort(keys.begin(), keys.end());
+
+    // Renumber vertices in order of first use by the sorted triangles
+    const unsigned int unused = ~0u;
+    std::vector<unsigned int> remap(vertices.size(), unused);
+    std::vector<Vec3f> new_vertices;
+    new_vertices.reserve(vertices.size());
+    std::vector<Vec3ui> new_faces(faces.size());
+
+    for (size_t t = 0; t < keys.size(); ++t) {
+        const Vec3ui& f = faces[keys[t].second];
+        for (int c = 0; c < 3; ++c) {
+            unsigned int v = f[c];
+            if (remap[v] == unused) {
+                remap[v] = (unsigned int)new_vertices.size();
+                new_vertices.push_back(vertices[v]);
+            }
+            new_faces[t][c] = remap[v];
+        }
+    }
+
+    // Keep unreferenced vertices so the mesh bounds do not change
+    for (size_t v = 0; v < vertices.size(); ++v) {
+        if (remap[v] == unused) new_vertices.push_back(vertices[v]);
+    }
+
+    vertices.swap(new_vertices);
+    faces.swap(new_faces);
+}
+
+} // namespace meshio
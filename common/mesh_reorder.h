@@ -0,0 +1,32 @@
+// SDFGen - Signed Distance Field Generator
+// Spatial reordering of mesh triangles and vertices
+// Copyright (c) 2025 Brad Chamberlain
+// Licensed under the MIT License - see LICENSE file
+
+#pragma once
+
+#include "vec.h"
+#include <vector>
+
+namespace meshio {
+
+/**
+ * @brief Reorder a mesh so that consecutive triangles are spatially close
+ *
+ * Triangles are sorted along a Morton (Z-order) curve of their centroids,
+ * with Z as the most significant axis to match the i-fastest layout of
+ * Array3. Consecutive triangles then rasterize into neighbouring grid
+ * cells, so the distance grid and vertex data stay in cache. Vertices are
+ * renumbered in order of first use; unreferenced vertices are kept at the
+ * end so the mesh bounds are unchanged.
+ *
+ * The resulting SDF is the same up to tie-breaking between equidistant
+ * triangles.
+ *
+ * @param vertices Vertex positions (permuted in-place)
+ * @param faces Triangle indices (permuted and remapped in-place)
+ */
+void reorder_for_locality(std::vector<Vec3f>& vertices,
+                          std::vector<Vec3ui>& faces);
+
+} // namespace meshio
@@ -3,15 +3,220 @@
 // Licensed under the MIT License - see LICENSE file
 
 #include "sdf_io.h"
+#include "config.h"
+#include <algorithm>
+#include <cmath>
+#include <cstring>
 #include <fstream>
 #include <iostream>
 #include <vector>
 
-bool write_sdf_binary(const std::string& filename,
-                      const Array3f& phi_grid,
-                      const Vec3f& min_box,
-                      float dx,
-                      int* out_inside_count) {
+#ifdef HAVE_ZSTD
+#include <zstd.h>
+#endif
+
+static const char SDF_MAGIC[4] = {'S', 'D', 'F', 'G'};
+
+// zstd level: fast, and SDFs compress well at low levels
+static const int SDF_ZSTD_LEVEL = 3;
+
+bool sdf_compression_available(SdfCompression compression) {
+#ifdef HAVE_ZSTD
+    return compression == SdfCompression::None || compression == SdfCompression::Zstd;
+#else
+    return compression == SdfCompression::None;
+#endif
+}
+
+size_t sdf_dtype_size(SdfDtype dtype) {
+    switch (dtype) {
+        case SdfDtype::Float16: return sizeof(uint16_t);
+        case SdfDtype::UInt8: return sizeof(uint8_t);
+        default: return sizeof(float);
+    }
+}
+
+uint16_t float_to_half(float value) {
+    uint32_t x;
+    std::memcpy(&x, &value, sizeof(x));
+    uint32_t sign = (x >> 16) & 0x8000u;
+    uint32_t mag = x & 0x7FFFFFFFu;
+
+    // Inf and NaN
+    if (mag >= 0x7F800000u) {
+        return (uint16_t)(sign | 0x7C00u | (mag > 0x7F800000u ? 0x200u : 0u));
+    }
+
+    // Rounds past the largest half (65504)
+    if (mag >= 0x477FF000u) {
+        return (uint16_t)(sign | 0x7C00u);
+    }
+
+    // Subnormal halves (or zero)
+    if (mag < 0x38800000u) {
+        if (mag < 0x33000000u) return (uint16_t)sign;
+        uint32_t shift = 126 - (mag >> 23);
+        uint32_t m = (mag & 0x7FFFFFu) | 0x800000u;
+        uint32_t h = m >> shift;
+        uint32_t rem = m & ((1u << shift) - 1);
+        uint32_t halfway = 1u << (shift - 1);
+        if (rem > halfway || (rem == halfway && (h & 1u))) h++;
+        return (uint16_t)(sign | h);
+    }
+
+    // Normal halves: rebias the exponent and round off 13 mantissa bits
+    uint32_t h = (mag - 0x38000000u) >> 13;
+    uint32_t rem = mag & 0x1FFFu;
+    if (rem > 0x1000u || (rem == 0x1000u && (h & 1u))) h++;
+    return (uint16_t)(sign | h);
+}
+
+float half_to_float(uint16_t value) {
+    uint32_t sign = (uint32_t)(value & 0x8000u) << 16;
+    uint32_t exp = (value >> 10) & 0x1Fu;
+    uint32_t mant = value & 0x3FFu;
+    uint32_t x;
+
+    if (exp == 0) {
+        float f = std::ldexp((float)mant, -24);
+        return sign ? -f : f;
+    } else if (exp == 31) {
+        x = sign | 0x7F800000u | (mant << 13);
+    } else {
+        x = sign | ((exp + 112) << 23) | (mant << 13);
+    }
+
+    float f;
+    std::memcpy(&f, &x, sizeof(f));
+    return f;
+}
+
+void quantize_sdf(const float* src, size_t count, SdfDtype dtype,
+                  void* dst, float& scale, float& offset) {
+    scale = 1.0f;
+    offset = 0.0f;
+
+    if (dtype == SdfDtype::Float16) {
+        uint16_t* out = static_cast<uint16_t*>(dst);
+        for (size_t n = 0; n < count; ++n) out[n] = float_to_half(src[n]);
+    } else if (dtype == SdfDtype::UInt8) {
+        // Map [min, max] of the grid onto 0..255
+        float lo = count > 0 ? src[0] : 0.0f;
+        float hi = lo;
+        for (size_t n = 1; n < count; ++n) {
+            lo = std::min(lo, src[n]);
+            hi = std::max(hi, src[n]);
+        }
+
+        offset = lo;
+        scale = (hi - lo) / 255.0f;
+        float inv_scale = scale > 0.0f ? 1.0f / scale : 0.0f;
+
+        uint8_t* out = static_cast<uint8_t*>(dst);
+        for (size_t n = 0; n < count; ++n) {
+            float q = (src[n] - offset) * inv_scale + 0.5f;
+            out[n] = (uint8_t)std::min(std::max(q, 0.0f), 255.0f);
+        }
+    } else {
+        std::memcpy(dst, src, count * sizeof(float));
+    }
+}
+
+void dequantize_sdf(const void* src, size_t count, SdfDtype dtype,
+                    float scale, float offset, float* dst) {
+    if (dtype == SdfDtype::Float16) {
+        const uint16_t* in = static_cast<const uint16_t*>(src);
+        for (size_t n = 0; n < count; ++n) dst[n] = half_to_float(in[n]);
+    } else if (dtype == SdfDtype::UInt8) {
+        const uint8_t* in = static_cast<const uint8_t*>(src);
+        for (size_t n = 0; n < count; ++n) dst[n] = in[n] * scale + offset;
+    } else {
+        std::memcpy(dst, src, count * sizeof(float));
+    }
+}
+
+// Write the legacy header for uncompressed float32 data, else the extended one
+static void write_sdf_header(std::ofstream& outfile,
+                             int ni, int nj, int nk,
+                             const Vec3f& min_box,
+                             float dx,
+                             SdfDtype dtype,
+                             SdfCompression compression,
+                             float scale,
+                             float offset) {
+    float bounds_max[3] = {min_box[0] + ni * dx, min_box[1] + nj * dx, min_box[2] + nk * dx};
+
+    if (dtype == SdfDtype::Float32 && compression == SdfCompression::None) {
+        // Legacy header: dimensions (3 x int32), bounds_min and bounds_max (3 x float32 each)
+        int dims[3] = {ni, nj, nk};
+        float bounds_min[3] = {min_box[0], min_box[1], min_box[2]};
+        outfile.write(reinterpret_cast<const char*>(dims), sizeof(dims));
+        outfile.write(reinterpret_cast<const char*>(bounds_min), sizeof(bounds_min));
+        outfile.write(reinterpret_cast<const char*>(bounds_max), sizeof(bounds_max));
+    } else {
+        SdfHeaderV2 header = {};
+        std::memcpy(header.magic, SDF_MAGIC, sizeof(SDF_MAGIC));
+        header.version = 2;
+        header.dims[0] = ni;
+        header.dims[1] = nj;
+        header.dims[2] = nk;
+        for (int a = 0; a < 3; ++a) {
+            header.min_box[a] = min_box[a];
+            header.max_box[a] = bounds_max[a];
+        }
+        header.dtype = (uint32_t)dtype;
+        header.scale = scale;
+        header.offset = offset;
+        header.compression = (uint32_t)compression;
+        outfile.write(reinterpret_cast<const char*>(&header), sizeof(header));
+    }
+}
+
+bool write_sdf_data(const std::string& filename,
+                    const float* data,
+                    int ni, int nj, int nk,
+                    const Vec3f& min_box,
+                    float dx,
+                    SdfDtype dtype,
+                    SdfCompression compression) {
+    if (!sdf_compression_available(compression)) {
+        std::cerr << "ERROR: SDFGen was built without support for the requested compression" << std::endl;
+        return false;
+    }
+
+    size_t count = (size_t)ni * nj * nk;
+
+    // Payload: float32 values are written as given, others are quantized
+    std::vector<char> buffer;
+    const char* payload = reinterpret_cast<const char*>(data);
+    size_t payload_size = count * sizeof(float);
+    float scale = 1.0f;
+    float offset = 0.0f;
+
+    if (dtype != SdfDtype::Float32) {
+        buffer.resize(count * sdf_dtype_size(dtype));
+        quantize_sdf(data, count, dtype, buffer.data(), scale, offset);
+        payload = buffer.data();
+        payload_size = buffer.size();
+    }
+
+#ifdef HAVE_ZSTD
+    if (compression == SdfCompression::Zstd) {
+        std::vector<char> compressed(ZSTD_compressBound(payload_size));
+        size_t compressed_size = ZSTD_compress(compressed.data(), compressed.size(),
+                                               payload, payload_size, SDF_ZSTD_LEVEL);
+        if (ZSTD_isError(compressed_size)) {
+            std::cerr << "ERROR: Failed to compress SDF data: "
+                      << ZSTD_getErrorName(compressed_size) << std::endl;
+            return false;
+        }
+        compressed.resize(compressed_size);
+        buffer.swap(compressed);
+        payload = buffer.data();
+        payload_size = buffer.size();
+    }
+#endif
+
     // Open file for binary writing
     std::ofstream outfile(filename.c_str(), std::ios::binary);
     if (!outfile) {
@@ -19,64 +224,108 @@ bool write_sdf_binary(const std::string& filename,
         return false;
     }
 
-    // Header: dimensions (3 x int32)
-    int ni = phi_grid.ni;
-    int nj = phi_grid.nj;
-    int nk = phi_grid.nk;
-    outfile.write(reinterpret_cast<char*>(&ni), sizeof(int));
-    outfile.write(reinterpret_cast<char*>(&nj), sizeof(int));
-    outfile.write(reinterpret_cast<char*>(&nk), sizeof(int));
-
-    // Header: bounds_min (3 x float32)
-    float bounds_min_x = min_box[0];
-    float bounds_min_y = min_box[1];
-    float bounds_min_z = min_box[2];
-    outfile.write(reinterpret_cast<char*>(&bounds_min_x), sizeof(float));
-    outfile.write(reinterpret_cast<char*>(&bounds_min_y), sizeof(float));
-    outfile.write(reinterpret_cast<char*>(&bounds_min_z), sizeof(float));
-
-    // Header: bounds_max (3 x float32)
-    float bounds_max_x = min_box[0] + phi_grid.ni * dx;
-    float bounds_max_y = min_box[1] + phi_grid.nj * dx;
-    float bounds_max_z = min_box[2] + phi_grid.nk * dx;
-    outfile.write(reinterpret_cast<char*>(&bounds_max_x), sizeof(float));
-    outfile.write(reinterpret_cast<char*>(&bounds_max_y), sizeof(float));
-    outfile.write(reinterpret_cast<char*>(&bounds_max_z), sizeof(float));
-
-    // Data: SDF values as float32
-    // Write in C-order (last dimension varies fastest): for(i) for(j) for(k)
-    int inside_count = 0;
-    for (int i = 0; i < phi_grid.ni; ++i) {
-        for (int j = 0; j < phi_grid.nj; ++j) {
-            for (int k = 0; k < phi_grid.nk; ++k) {
-                float val = static_cast<float>(phi_grid(i, j, k));
-                if (val < 0.0f) inside_count++;
-                outfile.write(reinterpret_cast<char*>(&val), sizeof(float));
-            }
-        }
-    }
+    write_sdf_header(outfile, ni, nj, nk, min_box, dx, dtype, compression, scale, offset);
+
+    // Data: one block in C-order (last dimension varies fastest)
+    outfile.write(payload, payload_size);
 
     // Check for write errors
     if (outfile.fail()) {
         std::cerr << "ERROR: Failed to write SDF data to file: " << filename << std::endl;
-        outfile.close();
         return false;
     }
 
-    outfile.close();
+    return true;
+}
 
-    // Return inside count if requested
-    if (out_inside_count != nullptr) {
-        *out_inside_count = inside_count;
+// Read either header from an open file and check the payload fits
+static bool read_sdf_header(std::ifstream& infile,
+                            const std::string& filename,
+                            SdfFileInfo& info) {
+    infile.seekg(0, std::ios::end);
+    size_t file_size = (size_t)infile.tellg();
+    infile.seekg(0);
+
+    // Extended files start with a magic; legacy files with Nx
+    char magic[4] = {};
+    infile.read(magic, sizeof(magic));
+
+    if (infile && std::memcmp(magic, SDF_MAGIC, sizeof(SDF_MAGIC)) == 0) {
+        SdfHeaderV2 header;
+        infile.seekg(0);
+        infile.read(reinterpret_cast<char*>(&header), sizeof(header));
+
+        if (infile.fail()) {
+            std::cerr << "ERROR: Failed to read SDF file header: " << filename << std::endl;
+            return false;
+        }
+
+        if (header.version != 2 || header.dtype > (uint32_t)SdfDtype::UInt8 ||
+            header.compression > (uint32_t)SdfCompression::Zstd) {
+            std::cerr << "ERROR: Unsupported SDF file header: " << filename << std::endl;
+            return false;
+        }
+
+        for (int a = 0; a < 3; ++a) info.dims[a] = header.dims[a];
+        info.min_box = Vec3f(header.min_box[0], header.min_box[1], header.min_box[2]);
+        info.max_box = Vec3f(header.max_box[0], header.max_box[1], header.max_box[2]);
+        info.dtype = (SdfDtype)header.dtype;
+        info.scale = header.scale;
+        info.offset = header.offset;
+        info.compression = (SdfCompression)header.compression;
+        info.data_offset = sizeof(SdfHeaderV2);
+    } else {
+        // Legacy header: dimensions (3 x int32), bounds_min and bounds_max (3 x float32 each)
+        float bounds[6];
+        infile.clear();
+        infile.seekg(0);
+        infile.read(reinterpret_cast<char*>(info.dims), sizeof(info.dims));
+        infile.read(reinterpret_cast<char*>(bounds), sizeof(bounds));
+
+        if (infile.fail()) {
+            std::cerr << "ERROR: Failed to read SDF file header: " << filename << std::endl;
+            return false;
+        }
+
+        info.min_box = Vec3f(bounds[0], bounds[1], bounds[2]);
+        info.max_box = Vec3f(bounds[3], bounds[4], bounds[5]);
+        info.dtype = SdfDtype::Float32;
+        info.scale = 1.0f;
+        info.offset = 0.0f;
+        info.compression = SdfCompression::None;
+        info.data_offset = sizeof(info.dims) + sizeof(bounds);
+    }
+
+    // Validate dimensions
+    if (info.dims[0] <= 0 || info.dims[1] <= 0 || info.dims[2] <= 0) {
+        std::cerr << "ERROR: Invalid dimensions in SDF file: "
+                  << info.dims[0] << "x" << info.dims[1] << "x" << info.dims[2] << std::endl;
+        return false;
+    }
+
+    size_t count = (size_t)info.dims[0] * info.dims[1] * info.dims[2];
+    if (info.compression == SdfCompression::None &&
+        file_size < info.data_offset + count * sdf_dtype_size(info.dtype)) {
+        std::cerr << "ERROR: SDF file is truncated: " << filename << std::endl;
+        return false;
     }
 
     return true;
 }
 
-bool read_sdf_binary(const std::string& filename,
-                     Array3f& phi_grid,
-                     Vec3f& min_box,
-                     Vec3f& max_box) {
+bool read_sdf_info(const std::string& filename, SdfFileInfo& info) {
+    std::ifstream infile(filename.c_str(), std::ios::binary);
+    if (!infile) {
+        std::cerr << "ERROR: Failed to open file for reading: " << filename << std::endl;
+        return false;
+    }
+
+    return read_sdf_header(infile, filename, info);
+}
+
+bool read_sdf_data(const std::string& filename,
+                   SdfFileInfo& info,
+                   std::vector<float>& data) {
     // Open file for binary reading
     std::ifstream infile(filename.c_str(), std::ios::binary);
     if (!infile) {
@@ -84,64 +333,155 @@ bool read_sdf_binary(const std::string& filename,
         return false;
     }
 
-    // Read header: dimensions (3 x int32)
-    int ni, nj, nk;
-    infile.read(reinterpret_cast<char*>(&ni), sizeof(int));
-    infile.read(reinterpret_cast<char*>(&nj), sizeof(int));
-    infile.read(reinterpret_cast<char*>(&nk), sizeof(int));
+    if (!read_sdf_header(infile, filename, info)) {
+        return false;
+    }
 
-    // Validate dimensions
-    if (ni <= 0 || nj <= 0 || nk <= 0) {
-        std::cerr << "ERROR: Invalid dimensions in SDF file: "
-                  << ni << "x" << nj << "x" << nk << std::endl;
-        infile.close();
+    if (!sdf_compression_available(info.compression)) {
+        std::cerr << "ERROR: SDF file is compressed, but SDFGen was built without zstd: "
+                  << filename << std::endl;
         return false;
     }
 
-    // Read header: bounds_min (3 x float32)
-    float bounds_min_x, bounds_min_y, bounds_min_z;
-    infile.read(reinterpret_cast<char*>(&bounds_min_x), sizeof(float));
-    infile.read(reinterpret_cast<char*>(&bounds_min_y), sizeof(float));
-    infile.read(reinterpret_cast<char*>(&bounds_min_z), sizeof(float));
+    size_t count = (size_t)info.dims[0] * info.dims[1] * info.dims[2];
+    data.resize(count);
+
+    // Uncompressed float32 payloads are read straight into the output
+    if (info.dtype == SdfDtype::Float32 && info.compression == SdfCompression::None) {
+        infile.seekg(info.data_offset);
+        infile.read(reinterpret_cast<char*>(data.data()), count * sizeof(float));
+        if (infile.fail()) {
+            std::cerr << "ERROR: Failed to read SDF data: " << filename << std::endl;
+            return false;
+        }
+        return true;
+    }
+
+    std::vector<char> payload(count * sdf_dtype_size(info.dtype));
+
+    if (info.compression == SdfCompression::None) {
+        infile.seekg(info.data_offset);
+        infile.read(payload.data(), payload.size());
+        if (infile.fail()) {
+            std::cerr << "ERROR: Failed to read SDF data: " << filename << std::endl;
+            return false;
+        }
+    }
+#ifdef HAVE_ZSTD
+    else {
+        infile.seekg(0, std::ios::end);
+        size_t compressed_size = (size_t)infile.tellg() - info.data_offset;
+        std::vector<char> compressed(compressed_size);
+        infile.seekg(info.data_offset);
+        infile.read(compressed.data(), compressed.size());
+
+        size_t size = infile.fail() ? 0 : ZSTD_decompress(payload.data(), payload.size(),
+                                                          compressed.data(), compressed.size());
+        if (infile.fail() || ZSTD_isError(size) || size != payload.size()) {
+            std::cerr << "ERROR: Failed to decompress SDF data: " << filename << std::endl;
+            return false;
+        }
+    }
+#endif
+
+    dequantize_sdf(payload.data(), count, info.dtype, info.scale, info.offset, data.data());
+    return true;
+}
+
+bool write_sdf_binary(const std::string& filename,
+                      const Array3f& phi_grid,
+                      const Vec3f& min_box,
+                      float dx,
+                      int* out_inside_count,
+                      SdfDtype dtype,
+                      SdfCompression compression) {
+    int ni = phi_grid.ni;
+    int nj = phi_grid.nj;
+    int nk = phi_grid.nk;
+    int inside_count = 0;
+
+    // Values go in C-order (last dimension varies fastest): for(i) for(j) for(k). Only
+    // quantized or compressed payloads need the whole grid gathered first; float32 is
+    // written one i-slice at a time, so the grid is not held in memory twice.
+    if (dtype == SdfDtype::Float32 && compression == SdfCompression::None) {
+        std::ofstream outfile(filename.c_str(), std::ios::binary);
+        if (!outfile) {
+            std::cerr << "ERROR: Failed to open file for writing: " << filename << std::endl;
+            return false;
+        }
+
+        write_sdf_header(outfile, ni, nj, nk, min_box, dx, dtype, compression, 1.0f, 0.0f);
+
+        std::vector<float> slice((size_t)nj * nk);
+        for (int i = 0; i < ni && outfile; ++i) {
+            size_t n = 0;
+            for (int j = 0; j < nj; ++j) {
+                for (int k = 0; k < nk; ++k) {
+                    float val = static_cast<float>(phi_grid(i, j, k));
+                    if (val < 0.0f) inside_count++;
+                    slice[n++] = val;
+                }
+            }
+            outfile.write(reinterpret_cast<const char*>(slice.data()), slice.size() * sizeof(float));
+        }
+
+        if (outfile.fail()) {
+            std::cerr << "ERROR: Failed to write SDF data to file: " << filename << std::endl;
+            return false;
+        }
+    } else {
+        std::vector<float> values((size_t)ni * nj * nk);
+        size_t n = 0;
+        for (int i = 0; i < ni; ++i) {
+            for (int j = 0; j < nj; ++j) {
+                for (int k = 0; k < nk; ++k) {
+                    float val = static_cast<float>(phi_grid(i, j, k));
+                    if (val < 0.0f) inside_count++;
+                    values[n++] = val;
+                }
+            }
+        }
+
+        if (!write_sdf_data(filename, values.data(), ni, nj, nk, min_box, dx, dtype, compression)) {
+            return false;
+        }
+    }
+
+    // Return inside count if requested
+    if (out_inside_count != nullptr) {
+        *out_inside_count = inside_count;
+    }
 
-    // Read header: bounds_max (3 x float32)
-    float bounds_max_x, bounds_max_y, bounds_max_z;
-    infile.read(reinterpret_cast<char*>(&bounds_max_x), sizeof(float));
-    infile.read(reinterpret_cast<char*>(&bounds_max_y), sizeof(float));
-    infile.read(reinterpret_cast<char*>(&bounds_max_z), sizeof(float));
+    return true;
+}
 
-    // Check if header reading was successful
-    if (infile.fail()) {
-        std::cerr << "ERROR: Failed to read SDF file header: " << filename << std::endl;
-        infile.close();
+bool read_sdf_binary(const std::string& filename,
+                     Array3f& phi_grid,
+                     Vec3f& min_box,
+                     Vec3f& max_box) {
+    SdfFileInfo info;
+    std::vector<float> values;
+    if (!read_sdf_data(filename, info, values)) {
         return false;
     }
 
     // Store bounding box
-    min_box = Vec3f(bounds_min_x, bounds_min_y, bounds_min_z);
-    max_box = Vec3f(bounds_max_x, bounds_max_y, bounds_max_z);
+    min_box = info.min_box;
+    max_box = info.max_box;
 
-    // Resize phi_grid to match dimensions
+    // Values are in C-order (same order as written): for(i) for(j) for(k)
+    int ni = info.dims[0];
+    int nj = info.dims[1];
+    int nk = info.dims[2];
     phi_grid.resize(ni, nj, nk);
-
-    // Read data: SDF values as float32
-    // Read in C-order (same order as written): for(i) for(j) for(k)
+    size_t n = 0;
     for (int i = 0; i < ni; ++i) {
         for (int j = 0; j < nj; ++j) {
             for (int k = 0; k < nk; ++k) {
-                float val;
-                infile.read(reinterpret_cast<char*>(&val), sizeof(float));
-                if (infile.fail()) {
-                    std::cerr << "ERROR: Failed to read SDF data at ("
-                              << i << "," << j << "," << k << ")" << std::endl;
-                    infile.close();
-                    return false;
-                }
-                phi_grid(i, j, k) = val;
+                phi_grid(i, j, k) = values[n++];
             }
         }
     }
 
-    infile.close();
     return true;
 }
@@ -6,7 +6,157 @@
 
 #include "array3.h"
 #include "vec.h"
+#include <cstddef>
+#include <cstdint>
 #include <string>
+#include <vector>
+
+/**
+ * @brief Storage type of SDF values in a file or quantized buffer
+ *
+ * Float32 is the full-precision legacy format. Float16 halves the size with
+ * about three significant digits. UInt8 quarters it, storing each value as
+ * q with value = q * scale + offset over the grid's [min, max] range.
+ */
+enum class SdfDtype : uint32_t {
+    Float32 = 0,
+    Float16 = 1,
+    UInt8 = 2
+};
+
+/**
+ * @brief Compression of the SDF payload in a file
+ *
+ * Zstd is only available when SDFGen is built with zstd (HAVE_ZSTD).
+ */
+enum class SdfCompression : uint32_t {
+    None = 0,
+    Zstd = 1
+};
+
+/**
+ * @brief Whether this build can read and write the given compression
+ */
+bool sdf_compression_available(SdfCompression compression);
+
+/**
+ * @brief Size in bytes of one stored SDF value
+ */
+size_t sdf_dtype_size(SdfDtype dtype);
+
+/**
+ * @brief Convert a float32 value to IEEE 754 half precision (round to nearest even)
+ */
+uint16_t float_to_half(float value);
+
+/**
+ * @brief Convert an IEEE 754 half precision value to float32
+ */
+float half_to_float(uint16_t value);
+
+/**
+ * @brief Quantize SDF values to a narrower storage type
+ *
+ * @param src Input values (float32)
+ * @param count Number of values
+ * @param dtype Storage type (Float32 copies the values unchanged)
+ * @param dst Output buffer of count * sdf_dtype_size(dtype) bytes
+ * @param scale Output scale (1 unless dtype is UInt8)
+ * @param offset Output offset (0 unless dtype is UInt8)
+ */
+void quantize_sdf(const float* src, size_t count, SdfDtype dtype,
+                  void* dst, float& scale, float& offset);
+
+/**
+ * @brief Expand quantized SDF values back to float32
+ *
+ * Inverse of quantize_sdf(): value = stored * scale + offset.
+ */
+void dequantize_sdf(const void* src, size_t count, SdfDtype dtype,
+                    float scale, float offset, float* dst);
+
+/**
+ * @brief Header of the extended SDF file format (quantized or compressed grids)
+ */
+struct SdfHeaderV2 {
+    char magic[4];         ///< "SDFG"
+    uint32_t version;      ///< 2
+    int32_t dims[3];       ///< Grid dimensions (Nx, Ny, Nz)
+    float min_box[3];      ///< Bounding box minimum
+    float max_box[3];      ///< Bounding box maximum
+    uint32_t dtype;        ///< SdfDtype of the stored values
+    float scale;           ///< value = stored * scale + offset
+    float offset;
+    uint32_t compression;  ///< SdfCompression of the payload
+    uint32_t reserved;
+};
+
+static_assert(sizeof(SdfHeaderV2) == 64, "SdfHeaderV2 must be 64 bytes");
+
+/**
+ * @brief Layout of an SDF file, as read from its header
+ *
+ * For uncompressed files the payload is the Nx*Ny*Nz stored values in
+ * C-order starting at data_offset, so it can be memory-mapped directly.
+ */
+struct SdfFileInfo {
+    int dims[3] = {0, 0, 0};
+    Vec3f min_box;
+    Vec3f max_box;
+    SdfDtype dtype = SdfDtype::Float32;
+    float scale = 1.0f;
+    float offset = 0.0f;
+    SdfCompression compression = SdfCompression::None;
+    size_t data_offset = 0;  ///< Byte offset of the payload in the file
+};
+
+/**
+ * @brief Write a C-ordered SDF buffer to a binary file
+ *
+ * Same file formats as write_sdf_binary(), but takes the values already in
+ * C-order (e.g. a NumPy array), so they are written without a transpose.
+ *
+ * @param filename Output file path
+ * @param data Nx*Ny*Nz values in C-order: for(i) for(j) for(k)
+ * @param ni, nj, nk Grid dimensions
+ * @param min_box Minimum corner of bounding box
+ * @param dx Grid cell spacing
+ * @param dtype Storage type of the values (default: Float32)
+ * @param compression Payload compression (default: None)
+ * @return true on success, false on error
+ */
+bool write_sdf_data(const std::string& filename,
+                    const float* data,
+                    int ni, int nj, int nk,
+                    const Vec3f& min_box,
+                    float dx,
+                    SdfDtype dtype = SdfDtype::Float32,
+                    SdfCompression compression = SdfCompression::None);
+
+/**
+ * @brief Read the header of an SDF file in either format
+ *
+ * Also checks that an uncompressed file is long enough for its payload.
+ *
+ * @param filename Input file path
+ * @param info Output file layout
+ * @return true on success, false on error
+ */
+bool read_sdf_info(const std::string& filename, SdfFileInfo& info);
+
+/**
+ * @brief Read an SDF file into a C-ordered float32 buffer
+ *
+ * Decompresses and dequantizes as needed.
+ *
+ * @param filename Input file path
+ * @param info Output file layout
+ * @param data Output Nx*Ny*Nz values in C-order
+ * @return true on success, false on error
+ */
+bool read_sdf_data(const std::string& filename,
+                   SdfFileInfo& info,
+                   std::vector<float>& data);
 
 /**
  * @brief Write a signed distance field to a binary file
@@ -22,18 +172,30 @@
  *   - Positive values = outside mesh
  *   - Zero = surface
  *
+ * Quantized (dtype Float16 or UInt8) or compressed grids use the extended format:
+ * - Header (64 bytes, see SdfHeaderV2):
+ *   - char[4] magic "SDFG", uint32 version (2)
+ *   - 3 x int32 dimensions, 3 x float32 bounds minimum, 3 x float32 bounds maximum
+ *   - uint32 dtype, float32 scale, float32 offset, uint32 compression, 4 reserved bytes
+ * - Data (Nx*Ny*Nz values of the stored dtype, same C-order), optionally as
+ *   a single zstd frame
+ *
  * @param filename Output file path
  * @param phi_grid SDF grid data (Array3f from make_level_set3)
  * @param min_box Minimum corner of bounding box
  * @param dx Grid cell spacing
  * @param out_inside_count Optional output: number of cells with negative SDF (inside mesh)
+ * @param dtype Storage type of the values (default: Float32, legacy format)
+ * @param compression Payload compression (default: None)
  * @return true on success, false on error
  */
 bool write_sdf_binary(const std::string& filename,
                       const Array3f& phi_grid,
                       const Vec3f& min_box,
                       float dx,
-                      int* out_inside_count = nullptr);
+                      int* out_inside_count = nullptr,
+                      SdfDtype dtype = SdfDtype::Float32,
+                      SdfCompression compression = SdfCompression::None);
 
 /**
  * @brief Read a signed distance field from a binary file
@@ -46,6 +208,9 @@ bool write_sdf_binary(const std::string& filename,
  * - Data (Nx*Ny*Nz x float32):
  *   - SDF values in C-order: for(i) for(j) for(k) read(value)
  *
+ * Files in the extended format are detected by their magic, decompressed
+ * and expanded back to float32.
+ *
  * @param filename Input file path
  * @param phi_grid Output SDF grid data (will be resized)
  * @param min_box Output minimum corner of bounding box
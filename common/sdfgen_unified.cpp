@@ -36,7 +36,10 @@ void make_level_set3(
     Array3f& phi,
     int exact_band,
     HardwareBackend backend,
-    int num_threads)
+    int num_threads,
+    FarFieldMethod method,
+    int grid_nx,
+    int slab_x0)
 {
     // Handle Auto mode: try GPU first (if available at runtime), fall back to CPU
     if (backend == HardwareBackend::Auto) {
@@ -50,12 +53,16 @@ void make_level_set3(
     // Dispatch to appropriate implementation
     switch (backend) {
         case HardwareBackend::CPU:
-            cpu::make_level_set3(tri, x, origin, dx, nx, ny, nz, phi, exact_band, num_threads);
+            cpu::make_level_set3(tri, x, origin, dx, nx, ny, nz, phi, exact_band, num_threads, method,
+                                 grid_nx, slab_x0);
             break;
 
-        case HardwareBackend::GPU:
+        case HardwareBackend::GPU: {
 #ifdef HAVE_CUDA
-            gpu::make_level_set3(tri, x, origin, dx, nx, ny, nz, phi, exact_band);
+            // The GPU generates a slab as a grid of its own
+            Vec3f slab_origin = origin;
+            if (grid_nx > 0) slab_origin[0] += slab_x0 * dx;
+            gpu::make_level_set3(tri, x, slab_origin, dx, nx, ny, nz, phi, exact_band);
 #else
             throw std::runtime_error(
                 "GPU backend requested but CUDA support is not available. "
@@ -63,6 +70,7 @@ void make_level_set3(
             );
 #endif
             break;
+        }
 
         case HardwareBackend::Auto:
             // Should never reach here due to Auto resolution above
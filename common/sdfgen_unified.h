@@ -6,6 +6,7 @@
 
 #include "array3.h"
 #include "vec.h"
+#include "../cpu_lib/makelevelset3.h"
 #include <vector>
 
 namespace sdfgen {
@@ -27,11 +28,11 @@ enum class HardwareBackend {
  * distances indicate points outside. This is the unified interface that automatically
  * selects between CPU and GPU implementations based on hardware availability and user
  * preference. The function handles grid initialization, exact distance computation near
- * the surface, and fast sweeping for far-field propagation.
+ * the surface, and far-field propagation (feature transform or fast sweeping).
  *
  * @param tri Triangle indices (mesh topology), each Vec3ui contains 3 vertex indices
  * @param x Vertex positions (mesh geometry) in world coordinates
- * @param origin Grid origin point in world space (corner of grid)
+ * @param origin Grid origin point in world space (corner of grid; of the full grid for a slab)
  * @param dx Grid cell spacing (uniform in all dimensions)
  * @param nx Grid dimension in X (number of cells)
  * @param ny Grid dimension in Y (number of cells)
@@ -40,6 +41,11 @@ enum class HardwareBackend {
  * @param exact_band Distance band in cells for exact computation (default: 1)
  * @param backend Hardware selection: Auto, CPU, or GPU (default: Auto)
  * @param num_threads CPU thread count, 0 = auto-detect (only used for CPU backend)
+ * @param method Far-field propagation method (only used for CPU backend; the GPU sweeps)
+ * @param grid_nx X dimension of the full grid when this grid is the slab of nx slices
+ *                starting at slice slab_x0 of it, 0 if it is not a slab (only used for
+ *                CPU backend; see cpu::make_level_set3)
+ * @param slab_x0 First slice of the slab in the full grid
  *
  * @note When backend is Auto, GPU is tried first and falls back to CPU if unavailable
  * @note The exact_band parameter controls accuracy vs performance tradeoff
@@ -53,7 +59,10 @@ void make_level_set3(
     Array3f& phi,
     int exact_band = 1,
     HardwareBackend backend = HardwareBackend::Auto,
-    int num_threads = 0
+    int num_threads = 0,
+    FarFieldMethod method = FarFieldMethod::FeatureTransform,
+    int grid_nx = 0,
+    int slab_x0 = 0
 );
 
 /**
@@ -3,6 +3,7 @@
 // Licensed under the MIT License - see LICENSE file
 
 #include "makelevelset3.h"
+#include <cstdlib>
 #include <iostream>
 #include <thread>
 #include <vector>
@@ -150,6 +151,280 @@ static void sweep_range(const std::vector<Vec3ui> &tri, const std::vector<Vec3f>
    }
 }
 
+/**
+ * @brief Feature transform seeds of a full grid outside the slab of it being generated
+ *
+ * The i-axis pass of the full grid's feature transform also sees seed cells before and
+ * after the slab. Only the nearest of them on each side of an i row can win, so those
+ * are kept per row, for both kinds of seed, with their closest triangle. Features refer
+ * to them by outside_seed(), as the full grid's linear indices may not fit in an int.
+ */
+struct SlabSeeds {
+   int grid_ni;   // i-dimension of the full grid
+   int i_offset;  // full-grid i-index of the slab's first slice
+   // per side (0: before the slab, 1: after it), kind (0: near, 1: band) and row
+   // j+nj*k: full-grid i-index of the nearest seed cell (-1 if none) and its closest triangle
+   std::vector<int> cell_i[2][2], tri[2][2];
+};
+
+// Feature of the seed outside the slab on one side (0: before, 1: after) of row j+nj*k;
+// these are -2 and below, as -1 means no feature and the grid's own cells are >= 0
+static inline int outside_seed(int row, int side)
+{
+   return -2-(2*row+side);
+}
+
+// i-index in the grid (negative or >= ni for seeds outside a slab) and row j+nj*k of the
+// seed cell of feature s (not -1) of the given kind (0: near, 1: band)
+static inline void seed_cell(int s, int ni, int kind, const SlabSeeds *slab, int &i, int &row)
+{
+   if(s>=0){ i=s%ni; row=s/ni; return; }
+   int m=-2-s;
+   row=m/2;
+   i=slab->cell_i[m%2][kind][row]-slab->i_offset;
+}
+
+// Closest triangle of the seed of feature s (not -1) of the given kind
+static inline int seed_triangle(int s, int kind, const Array3i &closest_tri, const SlabSeeds *slab)
+{
+   if(s>=0) return closest_tri.a[s];
+   int m=-2-s;
+   return slab->tri[m%2][kind][m/2];
+}
+
+/**
+ * @brief One 1D pass of the Felzenszwalb-Huttenlocher feature transform
+ *
+ * Computes the lower envelope of the parabolas (q-i)^2 + f(q) along one grid line,
+ * where f(q) is the squared distance from cell q to its current feature (nearest seed
+ * cell). Each cell of the line then takes the feature of the parabola that is lowest
+ * at its position. O(n) per line.
+ *
+ * @param feature Linear index of the nearest seed cell per cell (or outside_seed()),
+ *                -1 if none (updated in-place)
+ * @param ni Grid i-dimension (used to decode linear indices)
+ * @param nj Grid j-dimension (used to decode linear indices)
+ * @param slab Seeds outside the grid if it is a slab of a full grid, else null
+ * @param kind Kind of seed in feature (0: near, 1: band)
+ * @param start Linear index of the first cell of the line
+ * @param stride Linear index step between cells of the line
+ * @param n Number of cells in the line
+ * @param axis Axis the line runs along (0=i, 1=j, 2=k)
+ * @param line_feature Scratch space for n features
+ * @param f Scratch space for n squared distances
+ * @param v Scratch space for n parabola positions
+ * @param z Scratch space for n+1 envelope boundaries
+ */
+static void feature_transform_line(Array3i &feature, int ni, int nj, const SlabSeeds *slab,
+                                   int kind, long start, long stride, int n,
+                                   std::vector<int> &line_feature, std::vector<double> &f,
+                                   std::vector<int> &v, std::vector<double> &z)
+{
+   // squared distance from each cell of the line to its feature; after the earlier passes
+   // the feature lies in the cell's line or plane across this axis, so it has no offset
+   // along the line and the full distance is the one to minimize over
+   int count=0;
+   for(int q=0; q<n; ++q){
+      int s=feature.a[start+q*stride];
+      line_feature[q]=s;
+      if(s==-1) continue;
+      long cell=start+q*stride;
+      int si, srow;
+      seed_cell(s, ni, kind, slab, si, srow);
+      double di=(double)(cell%ni - si);
+      double dj=(double)((cell/ni)%nj - srow%nj);
+      double dk=(double)(cell/((long)ni*nj) - srow/nj);
+      f[q]=di*di+dj*dj+dk*dk;
+      ++count;
+   }
+   if(count==0) return;
+
+   // lower envelope of the parabolas rooted at the cells that have a feature
+   int k=-1;
+   for(int q=0; q<n; ++q){
+      if(line_feature[q]==-1) continue;
+      if(k<0){
+         k=0; v[0]=q; z[0]=-1e30; z[1]=1e30;
+         continue;
+      }
+      double s=((f[q]+(double)q*q)-(f[v[k]]+(double)v[k]*v[k]))/(2.0*(q-v[k]));
+      while(s<=z[k]){
+         --k;
+         s=((f[q]+(double)q*q)-(f[v[k]]+(double)v[k]*v[k]))/(2.0*(q-v[k]));
+      }
+      ++k;
+      v[k]=q; z[k]=s; z[k+1]=1e30;
+   }
+
+   // read off the feature of the lowest parabola at each cell
+   k=0;
+   for(int i=0; i<n; ++i){
+      while(z[k+1]<i) ++k;
+      feature.a[start+i*stride]=line_feature[v[k]];
+   }
+}
+
+/**
+ * @brief Take the nearer of a slab row's feature and the full grid's seeds beside the slab
+ *
+ * Completes the i-axis pass over the full grid's row: every feature is a seed of the row
+ * itself at that point, so the nearest one along the row wins, the lower index on ties
+ * like in the lower envelope.
+ *
+ * @param kind Kind of seed in feature (0: near, 1: band)
+ * @param row Row index j+nj*k
+ */
+static void merge_slab_seeds(Array3i &feature, const SlabSeeds &slab, int kind, int row)
+{
+   const int ni=feature.ni;
+   const int before=slab.cell_i[0][kind][row], after=slab.cell_i[1][kind][row];
+   int *line=&feature.a[(long)ni*row];
+   for(int i=0; i<ni; ++i){
+      int gi=i+slab.i_offset;
+      int best=-1, best_d=0;
+      if(before>=0){ best=outside_seed(row, 0); best_d=gi-before; }
+      if(line[i]>=0){
+         int d=std::abs(i-line[i]%ni);
+         if(best==-1 || d<best_d){ best=line[i]; best_d=d; }
+      }
+      if(after>=0 && (best==-1 || after-gi<best_d)) best=outside_seed(row, 1);
+      line[i]=best;
+   }
+}
+
+// Run one feature transform pass along an axis over lines outer_start <= outer < outer_end;
+// kind is the kind of seed in feature (0: near, 1: band), to merge the slab's seeds
+static void feature_transform_range(Array3i &feature, const SlabSeeds *slab, int kind, int axis,
+                                    int outer_start, int outer_end)
+{
+   int ni=feature.ni, nj=feature.nj, nk=feature.nk;
+   long sij=(long)ni*nj;
+   int n=(axis==0)?ni:(axis==1)?nj:nk;
+   std::vector<int> line_feature(n), v(n);
+   std::vector<double> f(n), z(n+1);
+
+   for(int outer=outer_start; outer<outer_end; ++outer){
+      if(axis==0){ // lines along i, indexed by (j, k=outer)
+         for(int j=0; j<nj; ++j){
+            feature_transform_line(feature, ni, nj, slab, kind, j*(long)ni+outer*sij, 1, n,
+                                   line_feature, f, v, z);
+            if(slab) merge_slab_seeds(feature, *slab, kind, j+nj*outer);
+         }
+      }else if(axis==1){ // lines along j, indexed by (i, k=outer)
+         for(int i=0; i<ni; ++i)
+            feature_transform_line(feature, ni, nj, slab, kind, i+outer*sij, ni, n,
+                                   line_feature, f, v, z);
+      }else{ // lines along k, indexed by (i, j=outer)
+         for(int i=0; i<ni; ++i)
+            feature_transform_line(feature, ni, nj, slab, kind, i+outer*(long)ni, sij, n,
+                                   line_feature, f, v, z);
+      }
+   }
+}
+
+/**
+ * @brief Finish the distances of k slices from their features and apply the signs
+ *
+ * Cells within dx of the surface are exact after the band pass. Every other cell,
+ * including band cells whose nearest triangle's box did not reach them, checks the
+ * closest triangles of the features of itself and its six face neighbours.
+ *
+ * The sign comes from the parity of the intersection counts along each i row. Rows
+ * are walked in i order anyway, so the sign is applied in the same traversal instead
+ * of a separate pass that streams the grid from memory again.
+ *
+ * @param near_feature Nearest cell within dx of the surface, per cell
+ * @param band_feature Nearest band cell, per cell (covers triangles clamped onto the
+ *                     grid boundary, which have no cell near them inside the grid)
+ * @param intersection_count Mesh crossings in (i-1,i] of each row
+ * @param all_triangles Check every triangle instead of the features' (tiny meshes;
+ *                      the feature arrays are then unused and may be empty)
+ * @param origin Origin of the full grid
+ * @param slab Position in the full grid and seeds outside it if the grid is a slab, else null
+ *             (the seeds are unused, and may be missing, with all_triangles)
+ * @param k_start First k slice to process
+ * @param k_end One past the last k slice to process
+ */
+static void far_field_range(const std::vector<Vec3ui> &tri, const std::vector<Vec3f> &x,
+                            Array3f &phi, const Array3i &closest_tri,
+                            const Array3i &near_feature, const Array3i &band_feature,
+                            const Array3i &intersection_count,
+                            const Vec3f &origin, float dx, bool all_triangles,
+                            const SlabSeeds *slab, int k_start, int k_end)
+{
+   const int ni=phi.ni, nj=phi.nj, nk=phi.nk;
+   const int i_offset=slab ? slab->i_offset : 0;
+   const long sj=ni, sk=(long)ni*nj;
+   const int* features[2] = {near_feature.a.data, band_feature.a.data};
+   for(int k=k_start; k<k_end; ++k) for(int j=0; j<nj; ++j){
+      long row=j*sj+k*sk;
+      int total_count=0;
+      for(int i=0; i<ni; ++i){
+         long idx=row+i;
+         total_count+=intersection_count.a[idx];
+         float sign=(total_count%2==1) ? -1.f : 1.f; // odd parity: inside the mesh
+
+         if(closest_tri.a[idx]>=0 && phi.a[idx]<=dx){ // already exact
+            phi.a[idx]*=sign;
+            continue;
+         }
+
+         // the cell and its face neighbours, as linear offsets (0 where off the grid)
+         long offsets[7] = {0,
+                            i>0 ? -1 : 0, i<ni-1 ? 1 : 0,
+                            j>0 ? -sj : 0, j<nj-1 ? sj : 0,
+                            k>0 ? -sk : 0, k<nk-1 ? sk : 0};
+
+         Vec3f gx((i+i_offset)*dx+origin[0], j*dx+origin[1], k*dx+origin[2]);
+         float d_min=phi.a[idx];
+         if(all_triangles){
+            for(unsigned int t=0; t<tri.size(); ++t){
+               unsigned int p, q, r; assign(tri[t], p, q, r);
+               d_min=min(d_min, point_triangle_distance(gx, x[p], x[q], x[r]));
+            }
+            phi.a[idx]=sign*d_min;
+            continue;
+         }
+
+         // neighbours mostly share the same few triangles, so each is checked once
+         int checked[14], num_checked=0;
+         for(int f=0; f<2; ++f) for(int n=0; n<7; ++n){
+            int s=features[f][idx+offsets[n]];
+            if(s==-1) continue;
+            int t=seed_triangle(s, f, closest_tri, slab);
+            bool seen=false;
+            for(int c=0; c<num_checked; ++c) seen=seen || checked[c]==t;
+            if(seen) continue;
+            checked[num_checked++]=t;
+            unsigned int p, q, r; assign(tri[t], p, q, r);
+            d_min=min(d_min, point_triangle_distance(gx, x[p], x[q], x[r]));
+         }
+         phi.a[idx]=sign*d_min;
+      }
+   }
+}
+
+// Run fn(start, end) over [0, n) split into contiguous ranges, one per thread
+template<class Fn>
+static void parallel_for(unsigned int threads, int n, Fn fn)
+{
+   unsigned int effective_threads = std::max(1u, std::min(threads, (unsigned int)n));
+   if(effective_threads == 1){ // no thread start-up cost for small grids
+      fn(0, n);
+      return;
+   }
+   int per_thread = n / (int)effective_threads;
+   std::vector<std::thread> thread_pool;
+   for(unsigned int t=0; t<effective_threads; ++t){
+      int start = t * per_thread;
+      int end = (t == effective_threads-1) ? n : start + per_thread;
+      thread_pool.emplace_back(fn, start, end);
+   }
+   for(auto& thread : thread_pool){
+      thread.join();
+   }
+}
+
 // calculate twice signed area of triangle (0,0)-(x1,y1)-(x2,y2)
 // return an SOS-determined sign (-1, +1, or 0 only if it's a truly degenerate triangle)
 static int orientation(double x1, double y1, double x2, double y2, double &twice_signed_area)
@@ -189,12 +464,102 @@ static bool point_in_triangle_2d(double x0, double y0,
 namespace sdfgen {
 namespace cpu {
 
+/**
+ * @brief Find the full grid's feature transform seeds nearest to a slab on each i row
+ *
+ * Repeats the full grid's band pass over the parts of the triangle boxes before and after
+ * the slab, but only far enough along each row to find the seed cell nearest to the
+ * slab, then finds the closest triangle of those cells the way the band pass does.
+ *
+ * @param origin Origin of the full grid
+ * @param ni Number of slices of the slab
+ * @param max_dist Initial distance of the full grid; cells no triangle is closer than
+ *                 this to are not seeds
+ * @param slab grid_ni and i_offset set; the seeds are filled in
+ */
+static void find_slab_seeds(const std::vector<Vec3ui> &tri, const std::vector<Vec3f> &x,
+                            const Vec3f &origin, float dx, int ni, int nj, int nk,
+                            int exact_band, float max_dist, SlabSeeds &slab)
+{
+   const int grid_ni=slab.grid_ni, i_offset=slab.i_offset;
+   std::vector<float> dist[2][2];
+   for(int side=0; side<2; ++side) for(int kind=0; kind<2; ++kind){
+      slab.cell_i[side][kind].assign((size_t)nj*nk, -1);
+      slab.tri[side][kind].assign((size_t)nj*nk, -1);
+      dist[side][kind].assign((size_t)nj*nk, max_dist);
+   }
+
+   for(int pass=0; pass<2; ++pass) for(unsigned int t=0; t<tri.size(); ++t){
+      unsigned int p, q, r; assign(tri[t], p, q, r);
+      double fip=((double)x[p][0]-origin[0])/dx, fjp=((double)x[p][1]-origin[1])/dx, fkp=((double)x[p][2]-origin[2])/dx;
+      double fiq=((double)x[q][0]-origin[0])/dx, fjq=((double)x[q][1]-origin[1])/dx, fkq=((double)x[q][2]-origin[2])/dx;
+      double fir=((double)x[r][0]-origin[0])/dx, fjr=((double)x[r][1]-origin[1])/dx, fkr=((double)x[r][2]-origin[2])/dx;
+      int i0=clamp(int(min(fip,fiq,fir))-exact_band, 0, grid_ni-1), i1=clamp(int(max(fip,fiq,fir))+exact_band+1, 0, grid_ni-1);
+      int j0=clamp(int(min(fjp,fjq,fjr))-exact_band, 0, nj-1), j1=clamp(int(max(fjp,fjq,fjr))+exact_band+1, 0, nj-1);
+      int k0=clamp(int(min(fkp,fkq,fkr))-exact_band, 0, nk-1), k1=clamp(int(max(fkp,fkq,fkr))+exact_band+1, 0, nk-1);
+      if(i0>=i_offset && i1<i_offset+ni) continue; // all inside the slab
+      for(int k=k0; k<=k1; ++k) for(int j=j0; j<=j1; ++j){
+         int row=j+nj*k;
+         if(pass==0){
+            // every box cell is a band cell; near cells need a distance within dx
+            if(i0<i_offset){
+               int last=min(i1, i_offset-1);
+               int &band=slab.cell_i[0][1][row], &near=slab.cell_i[0][0][row];
+               band=max(band, last);
+               for(int i=last; i>=i0 && i>near; --i){
+                  Vec3f gx(i*dx+origin[0], j*dx+origin[1], k*dx+origin[2]);
+                  if(point_triangle_distance(gx, x[p], x[q], x[r])<=dx){ near=i; break; }
+               }
+            }
+            if(i1>=i_offset+ni){
+               int first=max(i0, i_offset+ni);
+               int &band=slab.cell_i[1][1][row], &near=slab.cell_i[1][0][row];
+               if(band<0 || first<band) band=first;
+               for(int i=first; i<=i1 && (near<0 || i<near); ++i){
+                  Vec3f gx(i*dx+origin[0], j*dx+origin[1], k*dx+origin[2]);
+                  if(point_triangle_distance(gx, x[p], x[q], x[r])<=dx){ near=i; break; }
+               }
+            }
+         }else{
+            for(int side=0; side<2; ++side) for(int kind=0; kind<2; ++kind){
+               int i=slab.cell_i[side][kind][row];
+               if(i<i0 || i>i1) continue;
+               Vec3f gx(i*dx+origin[0], j*dx+origin[1], k*dx+origin[2]);
+               float d=point_triangle_distance(gx, x[p], x[q], x[r]);
+               if(d<dist[side][kind][row]){
+                  dist[side][kind][row]=d;
+                  slab.tri[side][kind][row]=t;
+               }
+            }
+         }
+      }
+   }
+
+   for(int side=0; side<2; ++side) for(int kind=0; kind<2; ++kind)
+      for(size_t row=0; row<slab.tri[side][kind].size(); ++row)
+         if(slab.tri[side][kind][row]<0) slab.cell_i[side][kind][row]=-1;
+}
+
 void make_level_set3(const std::vector<Vec3ui> &tri, const std::vector<Vec3f> &x,
                      const Vec3f &origin, float dx, int ni, int nj, int nk,
-                     Array3f &phi, const int exact_band, int num_threads)
+                     Array3f &phi, const int exact_band, int num_threads, FarFieldMethod method,
+                     int grid_ni, int slab_i0)
 {
+   if(grid_ni<=0){ grid_ni=ni; slab_i0=0; }
+
+   // A slab of a larger grid computes the full grid's band inside it for the feature
+   // transform, which then also takes the full grid's seeds outside the slab. Sweeping
+   // instead clamps triangle boxes onto the slab, so the triangles outside it propagate
+   // in from its boundary cells. The band pass works in the grid coordinates of the full
+   // grid in the first case, so it rounds exactly like the full grid, and of the slab in
+   // the second.
+   const bool fh_slab = method == FarFieldMethod::FeatureTransform && grid_ni > ni;
+   const Vec3f slab_origin(origin[0]+slab_i0*dx, origin[1], origin[2]);
+   const Vec3f &band_origin = fh_slab ? origin : slab_origin;
+   const int band_i0 = fh_slab ? slab_i0 : 0;
+
    phi.resize(ni, nj, nk);
-   phi.assign((ni+nj+nk)*dx); // upper bound on distance
+   phi.assign(((fh_slab ? grid_ni : ni)+nj+nk)*dx); // upper bound on distance
    Array3i closest_tri(ni, nj, nk, -1);
    Array3i intersection_count(ni, nj, nk, 0); // intersection_count(i,j,k) is # of tri intersections in (i-1,i]x{j}x{k}
 
@@ -203,15 +568,19 @@ void make_level_set3(const std::vector<Vec3ui> &tri, const std::vector<Vec3f> &x
    for(unsigned int t=0; t<tri.size(); ++t){
      unsigned int p, q, r; assign(tri[t], p, q, r);
      // coordinates in grid to high precision
-      double fip=((double)x[p][0]-origin[0])/dx, fjp=((double)x[p][1]-origin[1])/dx, fkp=((double)x[p][2]-origin[2])/dx;
-      double fiq=((double)x[q][0]-origin[0])/dx, fjq=((double)x[q][1]-origin[1])/dx, fkq=((double)x[q][2]-origin[2])/dx;
-      double fir=((double)x[r][0]-origin[0])/dx, fjr=((double)x[r][1]-origin[1])/dx, fkr=((double)x[r][2]-origin[2])/dx;
+      double fip=((double)x[p][0]-band_origin[0])/dx, fjp=((double)x[p][1]-band_origin[1])/dx, fkp=((double)x[p][2]-band_origin[2])/dx;
+      double fiq=((double)x[q][0]-band_origin[0])/dx, fjq=((double)x[q][1]-band_origin[1])/dx, fkq=((double)x[q][2]-band_origin[2])/dx;
+      double fir=((double)x[r][0]-band_origin[0])/dx, fjr=((double)x[r][1]-band_origin[1])/dx, fkr=((double)x[r][2]-band_origin[2])/dx;
       // do distances nearby
       int i0=clamp(int(min(fip,fiq,fir))-exact_band, 0, ni-1), i1=clamp(int(max(fip,fiq,fir))+exact_band+1, 0, ni-1);
+      if(fh_slab){ // the full grid's box, where it overlaps the slab
+         i0=max(clamp(int(min(fip,fiq,fir))-exact_band, 0, grid_ni-1), slab_i0)-slab_i0;
+         i1=min(clamp(int(max(fip,fiq,fir))+exact_band+1, 0, grid_ni-1), slab_i0+ni-1)-slab_i0;
+      }
       int j0=clamp(int(min(fjp,fjq,fjr))-exact_band, 0, nj-1), j1=clamp(int(max(fjp,fjq,fjr))+exact_band+1, 0, nj-1);
       int k0=clamp(int(min(fkp,fkq,fkr))-exact_band, 0, nk-1), k1=clamp(int(max(fkp,fkq,fkr))+exact_band+1, 0, nk-1);
       for(int k=k0; k<=k1; ++k) for(int j=j0; j<=j1; ++j) for(int i=i0; i<=i1; ++i){
-         Vec3f gx(i*dx+origin[0], j*dx+origin[1], k*dx+origin[2]);
+         Vec3f gx((i+band_i0)*dx+band_origin[0], j*dx+band_origin[1], k*dx+band_origin[2]);
          float d=point_triangle_distance(gx, x[p], x[q], x[r]);
          if(d<phi(i,j,k)){
             phi(i,j,k)=d;
@@ -227,7 +596,7 @@ void make_level_set3(const std::vector<Vec3ui> &tri, const std::vector<Vec3f> &x
          double a, b, c;
          if(point_in_triangle_2d(j, k, fjp, fkp, fjq, fkq, fjr, fkr, a, b, c)){
             double fi=a*fip+b*fiq+c*fir; // intersection i coordinate
-            int i_interval=int(std::ceil(fi)); // intersection is in (i_interval-1,i_interval]
+            int i_interval=int(std::ceil(fi))-band_i0; // intersection is in (i_interval-1,i_interval]
             if(i_interval<0) ++intersection_count(0, j, k); // we enlarge the first interval to include everything to the -x direction
             else if(i_interval<ni) ++intersection_count(i_interval,j,k);
             // we ignore intersections that are beyond the +x side of the grid
@@ -235,12 +604,59 @@ void make_level_set3(const std::vector<Vec3ui> &tri, const std::vector<Vec3f> &x
       }
    }
 
-   // Multi-threaded fast sweeping (FluidX3D approach - simple and fast)
    // Determine number of threads (0 = auto-detect)
    unsigned int threads = (num_threads <= 0) ? std::thread::hardware_concurrency() : (unsigned int)num_threads;
    if(threads == 0) threads = 4; // fallback
 
-   for(unsigned int pass=0; pass<2; ++pass){
+   // Starting a thread costs more than a small grid's share of the work, so small grids
+   // (e.g. many small meshes in a data pipeline) use fewer threads, down to none
+   const long cells_per_thread = 16384;
+   long max_threads = std::max(1L, (long)ni*nj*nk / cells_per_thread);
+   threads = (unsigned int)std::min((long)threads, max_threads);
+
+   if(method == FarFieldMethod::FeatureTransform){
+      // Felzenszwalb-Huttenlocher feature transform: find the nearest seed cell of every
+      // cell with three separable 1D passes, then take the distance to the seed's
+      // closest triangle. O(ni*nj*nk) with a few triangle queries per far cell.
+      // with only a handful of triangles, checking all of them from every far cell is
+      // cheaper than the transform passes, and exact rather than approximate
+      const size_t small_mesh_triangles = 4;
+      const bool all_triangles = tri.size() <= small_mesh_triangles;
+      Array3i near_feature, band_feature;
+      SlabSeeds seeds;
+      const SlabSeeds *slab = nullptr;
+      if(!all_triangles){
+         if(fh_slab){
+            seeds.grid_ni=grid_ni;
+            seeds.i_offset=slab_i0;
+            find_slab_seeds(tri, x, origin, dx, ni, nj, nk, exact_band, (grid_ni+nj+nk)*dx, seeds);
+            slab=&seeds;
+         }
+
+         // features are linear cell indices, as the seeds are the cells themselves
+         near_feature.resize(ni, nj, nk, -1);
+         band_feature.resize(ni, nj, nk, -1);
+         for(int idx=0; idx<(int)closest_tri.a.size(); ++idx){
+            if(closest_tri.a[idx]<0) continue;
+            band_feature.a[idx]=idx;
+            if(phi.a[idx]<=dx) near_feature.a[idx]=idx;
+         }
+
+         for(int axis=0; axis<3; ++axis){
+            parallel_for(threads, (axis<2) ? nk : nj, [&](int start, int end){
+               feature_transform_range(near_feature, slab, 0, axis, start, end);
+               feature_transform_range(band_feature, slab, 1, axis, start, end);
+            });
+         }
+      }
+      parallel_for(threads, nk, [&](int start, int end){
+         far_field_range(tri, x, phi, closest_tri, near_feature, band_feature, intersection_count,
+                         origin, dx, all_triangles, slab, start, end);
+      });
+   }
+
+   // Multi-threaded fast sweeping (FluidX3D approach - simple and fast)
+   for(unsigned int pass=0; method == FarFieldMethod::Sweep && pass<2; ++pass){
       // For each of the 8 sweep directions
       int sweep_dirs[8][3] = {
          {+1, +1, +1}, {-1, -1, -1}, {+1, +1, -1}, {-1, -1, +1},
@@ -265,6 +681,11 @@ void make_level_set3(const std::vector<Vec3ui> &tri, const std::vector<Vec3f> &x
          unsigned int effective_threads = std::min(threads, (unsigned int)k_range);
          if(effective_threads == 0) effective_threads = 1;
 
+         if(effective_threads == 1){
+            sweep_range(tri, x, phi, closest_tri, slab_origin, dx, di, dj, dk, k0, k1);
+            continue;
+         }
+
          int slices_per_thread = std::max(1, k_range / (int)effective_threads);
 
          for(unsigned int t=0; t<effective_threads; ++t){
@@ -280,7 +701,7 @@ void make_level_set3(const std::vector<Vec3ui> &tri, const std::vector<Vec3f> &x
             if((dk>0 && thread_k_start < thread_k_end) || (dk<0 && thread_k_start > thread_k_end)){
                thread_pool.emplace_back(sweep_range, std::ref(tri), std::ref(x),
                                    std::ref(phi), std::ref(closest_tri),
-                                   origin, dx, di, dj, dk, thread_k_start, thread_k_end);
+                                   slab_origin, dx, di, dj, dk, thread_k_start, thread_k_end);
             }
          }
 
@@ -291,8 +712,9 @@ void make_level_set3(const std::vector<Vec3ui> &tri, const std::vector<Vec3f> &x
       }
    }
 
-   // then figure out signs (inside/outside) from intersection counts
-   for(int k=0; k<nk; ++k) for(int j=0; j<nj; ++j){
+   // then figure out signs (inside/outside) from intersection counts; the feature
+   // transform path has already applied them while finishing the far field
+   for(int k=0; method == FarFieldMethod::Sweep && k<nk; ++k) for(int j=0; j<nj; ++j){
       int total_count=0;
       for(int i=0; i<ni; ++i){
          total_count+=intersection_count(i,j,k);
@@ -8,6 +8,15 @@
 #include "vec.h"
 
 namespace sdfgen {
+
+/**
+ * @brief How distances are carried from the exact band to the rest of the grid
+ */
+enum class FarFieldMethod {
+    FeatureTransform,  /**< Felzenszwalb-Huttenlocher feature transform of the band, O(N) with a few triangle queries per cell */
+    Sweep              /**< Fast sweeping, 16 sweeps checking the triangles of 7 neighbours; slower, slightly more accurate */
+};
+
 namespace cpu {
 
 /**
@@ -16,14 +25,14 @@ namespace cpu {
  * Computes a 3D signed distance field from a triangle mesh using CPU-based parallel processing.
  * The algorithm operates in two phases: (1) exact distance computation for grid cells within
  * exact_band of any triangle surface, and (2) fast sweeping to propagate distances to far-field
- * regions. The mesh should be closed and manifold for accurate inside/outside signs; triangle
+ * regions (see FarFieldMethod). The mesh should be closed and manifold for accurate inside/outside signs; triangle
  * soups will produce correct absolute distances but may have incorrect signs. The implementation
  * uses multi-threading to parallelize the computation across multiple CPU cores for improved
  * performance on large grids.
  *
  * @param tri Triangle indices defining mesh topology, each Vec3ui contains 3 vertex indices
  * @param x Vertex positions in world coordinates
- * @param origin Grid origin point (lower corner) in world space
+ * @param origin Grid origin point (lower corner) in world space; of the full grid for a slab
  * @param dx Grid cell spacing, uniform in all dimensions
  * @param nx Number of grid cells in X dimension
  * @param ny Number of grid cells in Y dimension
@@ -31,6 +40,11 @@ namespace cpu {
  * @param phi Output signed distance field array (will be resized to nx*ny*nz)
  * @param exact_band Width of exact computation band in grid cells (default: 1)
  * @param num_threads Number of CPU threads to use, 0 = auto-detect via hardware_concurrency (default: 0)
+ * @param method Far-field propagation method (default: FeatureTransform)
+ * @param grid_nx X dimension of the full grid when the grid is the slab of nx slices
+ *                starting at slice slab_x0 of it, 0 if the grid is not a slab (default: 0).
+ *                The feature transform then matches the full grid inside the slab.
+ * @param slab_x0 First slice of the slab in the full grid (default: 0)
  *
  * @note Distances within exact_band cells of triangles are computed exactly
  * @note Distances beyond exact_band may not be to the closest triangle but to a nearby one
@@ -38,7 +52,9 @@ namespace cpu {
  */
 void make_level_set3(const std::vector<Vec3ui> &tri, const std::vector<Vec3f> &x,
                      const Vec3f &origin, float dx, int nx, int ny, int nz,
-                     Array3f &phi, const int exact_band=1, int num_threads=0);
+                     Array3f &phi, const int exact_band=1, int num_threads=0,
+                     FarFieldMethod method=FarFieldMethod::FeatureTransform,
+                     int grid_nx=0, int slab_x0=0);
 
 } // namespace cpu
 } // namespace sdfgen
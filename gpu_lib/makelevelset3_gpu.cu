@@ -592,6 +592,27 @@ __global__ void sign_correction_kernel(float* phi, const int* intersection_count
 // Host Orchestrator
 // ============================================================================
 
+/**
+ * @brief Stream for the mesh upload and the event recorded when it completes
+ *
+ * Destroys both on every path out of make_level_set3.
+ */
+struct UploadStream {
+    cudaStream_t stream = nullptr;
+    cudaEvent_t done = nullptr;
+
+    UploadStream() {
+        CUDA_CHECK(cudaStreamCreateWithFlags(&stream, cudaStreamNonBlocking));
+        CUDA_CHECK(cudaEventCreateWithFlags(&done, cudaEventDisableTiming));
+    }
+    ~UploadStream() {
+        if (done) cudaEventDestroy(done);
+        if (stream) cudaStreamDestroy(stream);
+    }
+    UploadStream(const UploadStream&) = delete;
+    UploadStream& operator=(const UploadStream&) = delete;
+};
+
 void make_level_set3(const std::vector<Vec3ui> &tri, const std::vector<Vec3f> &x,
                      const Vec3f &origin, float dx, int ni, int nj, int nk,
                      Array3f &phi, const int exact_band)
@@ -629,16 +650,27 @@ void make_level_set3(const std::vector<Vec3ui> &tri, const std::vector<Vec3f> &x
     CUDA_CHECK(cudaMalloc(&d_closest_tri_read, num_grid_cells * sizeof(int)));
     CUDA_CHECK(cudaMalloc(&d_closest_tri_write, num_grid_cells * sizeof(int)));
 
-    // Host to device copy
-    CUDA_CHECK(cudaMemcpy(d_tri, tri.data(), num_triangles * sizeof(Vec3ui), cudaMemcpyHostToDevice));
-    CUDA_CHECK(cudaMemcpy(d_x, x.data(), num_vertices * sizeof(Vec3f), cudaMemcpyHostToDevice));
-
     // Kernel 1: Initialize
     dim3 blockInit(8, 8, 8);
     dim3 gridInit((ni + 7) / 8, (nj + 7) / 8, (nk + 7) / 8);
     initialize_grids_kernel<<<gridInit, blockInit>>>(d_dist_tri, d_intersection_count, ni, nj, nk, (ni+nj+nk)*dx);
     CUDA_CHECK(cudaGetLastError());
-    CUDA_CHECK(cudaDeviceSynchronize());
+
+    // Host to device copy, on its own stream so that it is queued behind the grid
+    // initialization rather than after a device synchronization. The mesh is in
+    // pageable memory, which the driver stages through its own pinned buffers,
+    // so the copy only overlaps the kernel as far as that staging allows; a mesh
+    // is small next to the grid, and pinning it per call would cost more.
+    UploadStream upload;
+    CUDA_CHECK(cudaMemcpyAsync(d_tri, tri.data(), num_triangles * sizeof(Vec3ui),
+                               cudaMemcpyHostToDevice, upload.stream));
+    CUDA_CHECK(cudaMemcpyAsync(d_x, x.data(), num_vertices * sizeof(Vec3f),
+                               cudaMemcpyHostToDevice, upload.stream));
+    CUDA_CHECK(cudaEventRecord(upload.done, upload.stream));
+
+    // Kernels on the default stream already run in order; only the upload has to be
+    // waited for, and the host does not block until the result is copied back
+    CUDA_CHECK(cudaStreamWaitEvent(0, upload.done, 0));
 
     // Kernel 2: Near-band distances
     int blockNear = 256;
@@ -646,7 +678,6 @@ void make_level_set3(const std::vector<Vec3ui> &tri, const std::vector<Vec3f> &x
     near_band_distance_kernel<<<gridNear, blockNear>>>(d_tri, d_x, d_dist_tri, d_intersection_count,
                                                        num_triangles, origin, dx, ni, nj, nk, exact_band);
     CUDA_CHECK(cudaGetLastError());
-    CUDA_CHECK(cudaDeviceSynchronize());
 
     // Extract phi and triangle indices from DistTriPair
     CUDA_CHECK(cudaMemcpy2D(d_phi_read, sizeof(float), d_dist_tri, sizeof(DistTriPair),
@@ -655,12 +686,12 @@ void make_level_set3(const std::vector<Vec3ui> &tri, const std::vector<Vec3f> &x
                            (char*)d_dist_tri + offsetof(DistTriPair, tri_idx), sizeof(DistTriPair),
                            sizeof(int), num_grid_cells, cudaMemcpyDeviceToDevice));
 
-    // DEBUG: Check near-band distances
-    std::vector<float> debug_phi(num_grid_cells);
-    CUDA_CHECK(cudaMemcpy(debug_phi.data(), d_phi_read, num_grid_cells * sizeof(float), cudaMemcpyDeviceToHost));
-    float min_near = *std::min_element(debug_phi.begin(), debug_phi.end());
-    float max_near = *std::max_element(debug_phi.begin(), debug_phi.end());
-    // Debug output commented out for production use
+    // DEBUG: Check near-band distances (commented out for production; the copy
+    // would pull the whole grid back to the host and stall the device)
+    // std::vector<float> debug_phi(num_grid_cells);
+    // CUDA_CHECK(cudaMemcpy(debug_phi.data(), d_phi_read, num_grid_cells * sizeof(float), cudaMemcpyDeviceToHost));
+    // float min_near = *std::min_element(debug_phi.begin(), debug_phi.end());
+    // float max_near = *std::max_element(debug_phi.begin(), debug_phi.end());
     // float init_max = (ni+nj+nk)*dx;
     // int unchanged = 0, updated = 0;
     // for (float v : debug_phi) {
@@ -708,7 +739,6 @@ void make_level_set3(const std::vector<Vec3ui> &tri, const std::vector<Vec3f> &x
         //     std::cout << "  Iteration " << (iter+1) << ": min=" << min_val << ", max=" << max_val << ", avg=" << avg_val << std::endl;
         // }
     }
-    CUDA_CHECK(cudaDeviceSynchronize());
 
     // DEBUG: Sample values at specific points for comparison (commented out for production)
     // std::cout << "Sample distances before sign correction:" << std::endl;
@@ -741,9 +771,8 @@ void make_level_set3(const std::vector<Vec3ui> &tri, const std::vector<Vec3f> &x
     dim3 gridSign((nj + 15) / 16, (nk + 15) / 16);
     sign_correction_kernel<<<gridSign, blockSign>>>(d_phi_read, d_intersection_count, ni, nj, nk);
     CUDA_CHECK(cudaGetLastError());
-    CUDA_CHECK(cudaDeviceSynchronize());
 
-    // Device to host copy
+    // Device to host copy (synchronous, so it also waits for the kernels)
     phi.resize(ni, nj, nk);
     float* phi_data = &phi.a[0];
     CUDA_CHECK(cudaMemcpy(phi_data, d_phi_read, num_grid_cells * sizeof(float), cudaMemcpyDeviceToHost));
@@ -374,20 +374,20 @@ def example_6_different_resolutions():
 
     resolutions = [16, 32, 64, 128]
 
-    for res in resolutions:
-        sdf = sdfgen.generate_sdf(
-            vertices,
-            triangles,
-            origin=(-2, -2, -2),
-            dx=4.0 / res,
-            nx=res,
-            ny=res,
-            nz=res,
-        )
-
-        # Analyze surface quality
-        near_surface = np.sum(np.abs(sdf) < 0.1)
-        print(f"Resolution {res}³: {near_surface} cells near surface")
+    # Convert the mesh once and reuse it for every resolution
+    with sdfgen.Session(vertices, triangles) as session:
+        for res in resolutions:
+            sdf = session.generate_sdf(
+                origin=(-2, -2, -2),
+                dx=4.0 / res,
+                nx=res,
+                ny=res,
+                nz=res,
+            )
+
+            # Analyze surface quality
+            near_surface = np.sum(np.abs(sdf) < 0.1)
+            print(f"Resolution {res}³: {near_surface} cells near surface")
 
     print()
 
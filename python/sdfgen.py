@@ -29,10 +29,15 @@ __license__ = "MIT"
 try:
     from .sdfgen_ext import (
         load_mesh,
+        compute_bounds,
         generate_sdf,
         save_sdf,
-        load_sdf,
+        load_sdf as _load_sdf,
+        read_sdf_header,
+        quantize_sdf,
         is_gpu_available,
+        is_zstd_available,
+        Session,
     )
 except ImportError as e:
     raise ImportError(
@@ -40,75 +45,216 @@ except ImportError as e:
         "Make sure the package was built correctly with CMake and nanobind."
     ) from e
 
+import functools
+import hashlib
+import json
+import os
+import threading
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
-from typing import Tuple, Optional, Union
+from typing import List, Sequence, Tuple, Optional, Union
 
 
-def generate_from_mesh(
+def _as_mesh_array(array, dtype: type, name: str) -> np.ndarray:
+    """
+    Return array as a C-contiguous array of the given dtype.
+
+    Arrays that already qualify are returned as is, so the extension can read
+    them without an intermediate conversion. Anything else is converted once
+    here, with a warning, rather than on every call into the extension.
+    """
+    if isinstance(array, np.ndarray) and array.dtype == dtype and array.flags.c_contiguous:
+        return array
+
+    warnings.warn(
+        f"{name} copied to a C-contiguous {np.dtype(dtype).name} array; "
+        f"pass {np.dtype(dtype).name} C-contiguous input to avoid the copy",
+        stacklevel=3,
+    )
+    return np.ascontiguousarray(array, dtype=dtype)
+
+
+def load_sdf(
+    filename: str, mmap: bool = True
+) -> Tuple[np.ndarray, Tuple[float, float, float], float, Tuple]:
+    """
+    Load SDF from binary file.
+
+    Uncompressed float32 files are memory-mapped by default, so loading
+    costs no read and pages are only brought in as the array is accessed.
+    The map is copy-on-write: the array is writable, but changes never reach
+    the file. Quantized or compressed files are read and expanded to float32.
+
+    Parameters
+    ----------
+    filename : str
+        Input file path (.sdf)
+    mmap : bool, default=True
+        Memory-map the file when its format allows it. Pass False to read
+        the values into memory instead (e.g. to delete or overwrite the
+        file while the array is alive on Windows).
+
+    Returns
+    -------
+    sdf : ndarray, shape (nx, ny, nz), dtype float32
+        Signed distance field (an np.memmap when memory-mapped)
+    origin : tuple of float
+        Grid origin (x, y, z)
+    dx : float
+        Grid cell spacing
+    bounds : tuple
+        ((min_x, min_y, min_z), (max_x, max_y, max_z))
+    """
+    if mmap:
+        header = read_sdf_header(filename)
+        if header["dtype"] == "float32" and header["compression"] is None:
+            sdf = np.memmap(
+                filename,
+                dtype=np.float32,
+                mode="c",
+                offset=header["data_offset"],
+                shape=header["shape"],
+            )
+            return sdf, header["origin"], header["dx"], header["bounds"]
+
+    return _load_sdf(filename)
+
+
+def generate_sdf_chunked(
     vertices: np.ndarray,
     triangles: np.ndarray,
+    origin: Tuple[float, float, float],
+    dx: float,
     nx: int,
-    ny: Optional[int] = None,
-    nz: Optional[int] = None,
-    dx: Optional[float] = None,
-    padding: int = 1,
+    ny: int,
+    nz: int,
+    chunk_size: int = 64,
+    out: Optional[np.ndarray] = None,
     exact_band: int = 1,
     backend: str = "auto",
     num_threads: int = 0,
-) -> Tuple[np.ndarray, dict]:
+    method: str = "fh",
+) -> np.ndarray:
     """
-    Generate SDF from mesh arrays with automatic grid sizing.
+    Generate an SDF slab by slab to bound peak memory for large grids.
 
-    This is a convenience function that automatically computes grid parameters
-    based on mesh bounds and desired resolution.
+    The grid is produced in slabs of chunk_size X slices. X is the slowest
+    axis of the (nx, ny, nz) output, so every slab is one contiguous block of
+    out; passing an np.memmap lets grids larger than RAM be written
+    sequentially. Working memory is proportional to one slab rather than the
+    full grid, and the mesh is converted only once for all slabs.
 
     Parameters
     ----------
     vertices : ndarray, shape (N, 3), dtype float32
         Vertex positions
     triangles : ndarray, shape (M, 3), dtype uint32
-        Triangle indices
-    nx : int
-        Grid size in X dimension (or all dimensions if ny, nz not specified)
-    ny : int, optional
-        Grid size in Y dimension (computed proportionally if not specified)
-    nz : int, optional
-        Grid size in Z dimension (computed proportionally if not specified)
-    dx : float, optional
-        Grid cell spacing (computed from nx and bounds if not specified)
-    padding : int, default=1
-        Number of padding cells around mesh
+        Triangle indices (zero-based)
+    origin : tuple of float
+        Grid origin (x, y, z) in world space
+    dx : float
+        Grid cell spacing
+    nx, ny, nz : int
+        Grid dimensions
+    chunk_size : int, default=64
+        Number of X slices generated per slab
+    out : ndarray, shape (nx, ny, nz), dtype float32, optional
+        C-contiguous destination (e.g. an np.memmap). Allocated if not given.
     exact_band : int, default=1
         Distance band for exact computation
     backend : str, default="auto"
         Hardware backend: "auto", "cpu", or "gpu"
     num_threads : int, default=0
         Number of CPU threads (0 = auto-detect)
+    method : str, default="fh"
+        Far-field method on the CPU: "fh" or "sweep" (see generate_sdf)
 
     Returns
     -------
     sdf : ndarray, shape (nx, ny, nz), dtype float32
-        Signed distance field
-    metadata : dict
-        Dictionary with keys: origin, dx, bounds, backend
+        Signed distance field (out, if given)
+
+    Examples
+    --------
+    >>> out = np.lib.format.open_memmap("sdf.npy", mode="w+", dtype=np.float32,
+    ...                                 shape=(1024, 1024, 1024))
+    >>> sdfgen.generate_sdf_chunked(vertices, triangles, origin, dx,
+    ...                             1024, 1024, 1024, chunk_size=16, out=out)
+    """
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+
+    vertices = _as_mesh_array(vertices, np.float32, "vertices")
+    triangles = _as_mesh_array(triangles, np.uint32, "triangles")
+
+    if out is None:
+        out = np.empty((nx, ny, nz), dtype=np.float32)
+    elif out.shape != (nx, ny, nz):
+        raise ValueError(f"Output buffer shape {out.shape} does not match grid {(nx, ny, nz)}")
+
+    origin = tuple(origin)
+    with Session(vertices, triangles) as session:
+        for x0 in range(0, nx, chunk_size):
+            x1 = min(x0 + chunk_size, nx)
+            session.generate_slab(
+                origin,
+                dx,
+                nx,
+                ny,
+                nz,
+                x0,
+                x1,
+                out[x0:x1],
+                exact_band=exact_band,
+                backend=backend,
+                num_threads=num_threads,
+                method=method,
+            )
+
+    return out
+
+
+def _compute_grid(
+    min_box: np.ndarray,
+    max_box: np.ndarray,
+    nx: Optional[int],
+    ny: Optional[int],
+    nz: Optional[int],
+    dx: Optional[float],
+    padding: int,
+) -> Tuple[int, int, int, float, np.ndarray]:
+    """
+    Resolve grid dimensions, cell spacing and origin from mesh bounds.
+
+    Shared by generate_from_mesh and generate_from_file. Returns the padded
+    grid dimensions (nx, ny, nz), the cell spacing dx and the grid origin.
     """
-    # Compute bounding box
-    min_box = vertices.min(axis=0)
-    max_box = vertices.max(axis=0)
     extents = max_box - min_box
 
-    # Compute grid parameters
-    if ny is None or nz is None:
-        # Proportional sizing
-        if dx is None:
+    # Determine cell size: Mode 1 (dx given, like the CLI) uses it as is,
+    # Mode 2 derives it from the grid dimensions
+    if dx is None:
+        if nx is None:
+            raise ValueError(
+                "Must specify either 'dx' or 'nx' (or 'nx', 'ny', 'nz') for grid sizing"
+            )
+        if ny is None or nz is None:
+            # Proportional sizing
             dx = extents[0] / nx
-        ny = int(np.ceil(extents[1] / dx)) if ny is None else ny
-        nz = int(np.ceil(extents[2] / dx)) if nz is None else nz
-    else:
-        # Manual sizing
-        if dx is None:
+        else:
+            # Manual sizing - compute dx from largest dimension
             dx = max(extents[0] / nx, extents[1] / ny, extents[2] / nz)
 
+    # Fill in unspecified dimensions from the cell counts covering the extents,
+    # computed for all three axes in a single vector operation
+    if nx is None or ny is None or nz is None:
+        needed = np.ceil(extents / dx).astype(np.int64)
+        nx = int(needed[0]) if nx is None else nx
+        ny = int(needed[1]) if ny is None else ny
+        nz = int(needed[2]) if nz is None else nz
+
     # Add padding
     nx += 2 * padding
     ny += 2 * padding
@@ -117,11 +263,124 @@ def generate_from_mesh(
     # Adjust origin for padding
     origin = min_box - padding * dx
 
+    return nx, ny, nz, dx, origin
+
+
+@functools.lru_cache(maxsize=8)
+def _cached_session(filename: str, mtime_ns: int, size: int, reorder: bool = False) -> Session:
+    """
+    Load a mesh file into a Session, cached by path and file stamp.
+
+    The modification time and size are part of the cache key so that an
+    edited file is reloaded instead of served from the cache.
+    """
+    session = Session.from_file(filename)
+    if reorder:
+        session.reorder()
+    return session
+
+
+def _cached_generate(
+    cache_dir: str, filename: str, params: dict, generate
+) -> Tuple[np.ndarray, dict]:
+    """
+    Return the float32 (sdf, metadata) of generate(), cached on disk.
+
+    Entries are keyed by a hash of the mesh file's contents and the
+    generation parameters, so a copied or touched file still hits the cache
+    and an edited one misses it. An entry is the SDF in the uncompressed
+    float32 format, memory-mapped on a hit, plus its metadata as JSON. The
+    JSON is written last, so a partly written entry is never read; an entry
+    whose files are missing or unreadable (e.g. partly deleted) is a miss.
+    """
+    digest = hashlib.blake2b(digest_size=20)
+    with open(filename, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    # NumPy scalars (np.float32 dx, np.int64 nx) hash as the equivalent Python values
+    digest.update(json.dumps(params, sort_keys=True, default=lambda v: v.item()).encode())
+    path = os.path.join(cache_dir, digest.hexdigest())
+
+    try:
+        with open(path + ".json") as f:
+            metadata = json.load(f)
+        sdf = load_sdf(path + ".sdf")[0]
+    except (OSError, RuntimeError, ValueError):
+        sdf, metadata = generate()
+
+        # Write under a unique name and rename, so concurrent writers of the
+        # same entry cannot interleave
+        os.makedirs(cache_dir, exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        save_sdf(tmp, sdf, metadata["origin"], metadata["dx"])
+        os.replace(tmp, path + ".sdf")
+        with open(tmp, "w") as f:
+            json.dump(metadata, f, default=float)
+        os.replace(tmp, path + ".json")
+        return sdf, metadata
+
+    metadata["origin"] = tuple(metadata["origin"])
+    metadata["bounds"] = tuple(tuple(b) for b in metadata["bounds"])
+    return sdf, metadata
+
+
+def _convert_sdf(
+    sdf: np.ndarray, metadata: dict, out: Optional[np.ndarray], dtype: str
+) -> Tuple[np.ndarray, dict]:
+    """Convert a float32 SDF to dtype, or copy it into out, as generation would."""
+    if dtype not in ("float32", "float16", "uint8"):
+        raise ValueError(f"Invalid dtype: {dtype} (must be 'float32', 'float16', or 'uint8')")
+
+    if out is not None:
+        if dtype != "float32":
+            raise ValueError("Output buffer is only supported for dtype 'float32'")
+        if out.shape != sdf.shape:
+            raise ValueError("Output buffer shape must be (nx, ny, nz)")
+        np.copyto(out, sdf)
+        return out, metadata
+
+    if dtype == "float16":
+        sdf = quantize_sdf(sdf, "float16")[0]
+    elif dtype == "uint8":
+        sdf, metadata["scale"], metadata["offset"] = quantize_sdf(sdf, "uint8")
+
+    return sdf, metadata
+
+
+def _generate_from_session(
+    session: Session,
+    bounds: Tuple[Tuple[float, float, float], Tuple[float, float, float]],
+    nx: Optional[int],
+    ny: Optional[int],
+    nz: Optional[int],
+    dx: Optional[float],
+    padding: int,
+    exact_band: int,
+    backend: str,
+    num_threads: int,
+    out: Optional[np.ndarray] = None,
+    dtype: str = "float32",
+    method: str = "fh",
+) -> Tuple[np.ndarray, dict]:
+    """Size the grid from the mesh bounds and generate the SDF of a session."""
+    # uint8 needs the value range, so it is quantized from the float32 grid
+    quantize = dtype == "uint8"
+    if quantize and out is not None:
+        raise ValueError("Output buffer is only supported for dtype 'float32'")
+
+    min_box = np.asarray(bounds[0], dtype=np.float32)
+    max_box = np.asarray(bounds[1], dtype=np.float32)
+
+    # Compute grid parameters
+    nx, ny, nz, dx, origin = _compute_grid(min_box, max_box, nx, ny, nz, dx, padding)
+
+    # Convert to Python floats once, for both the extension call and the metadata
+    origin = tuple(origin.tolist())
+    dx = float(dx)
+
     # Generate SDF
-    sdf = generate_sdf(
-        vertices,
-        triangles,
-        tuple(origin),
+    sdf = session.generate_sdf(
+        origin,
         dx,
         nx,
         ny,
@@ -129,19 +388,122 @@ def generate_from_mesh(
         exact_band=exact_band,
         backend=backend,
         num_threads=num_threads,
+        out=out,
+        dtype="float32" if quantize else dtype,
+        method=method,
     )
 
     # Prepare metadata
     metadata = {
-        "origin": tuple(origin),
+        "origin": origin,
         "dx": dx,
-        "bounds": (tuple(min_box), tuple(max_box)),
+        "bounds": (tuple(min_box.tolist()), tuple(max_box.tolist())),
         "backend": backend,
     }
 
+    if quantize:
+        sdf, metadata["scale"], metadata["offset"] = quantize_sdf(sdf, "uint8")
+
     return sdf, metadata
 
 
+def generate_from_mesh(
+    vertices: np.ndarray,
+    triangles: np.ndarray,
+    nx: Optional[int] = None,
+    ny: Optional[int] = None,
+    nz: Optional[int] = None,
+    dx: Optional[float] = None,
+    padding: int = 1,
+    exact_band: int = 1,
+    backend: str = "auto",
+    num_threads: int = 0,
+    bounds: Optional[Tuple[Tuple[float, float, float], Tuple[float, float, float]]] = None,
+    reorder: bool = False,
+    out: Optional[np.ndarray] = None,
+    dtype: str = "float32",
+    method: str = "fh",
+) -> Tuple[np.ndarray, dict]:
+    """
+    Generate SDF from mesh arrays with automatic grid sizing.
+
+    This is a convenience function that automatically computes grid parameters
+    based on mesh bounds and desired resolution.
+
+    Parameters
+    ----------
+    vertices : ndarray, shape (N, 3), dtype float32
+        Vertex positions. Other dtypes or non-contiguous layouts are copied
+        once, with a warning.
+    triangles : ndarray, shape (M, 3), dtype uint32
+        Triangle indices. Other dtypes or non-contiguous layouts are copied
+        once, with a warning.
+    nx : int, optional
+        Grid size in X dimension (or all dimensions if ny, nz not specified).
+        Required unless dx is given.
+    ny : int, optional
+        Grid size in Y dimension (computed proportionally if not specified)
+    nz : int, optional
+        Grid size in Z dimension (computed proportionally if not specified)
+    dx : float, optional
+        Grid cell spacing (computed from nx and bounds if not specified)
+    padding : int, default=1
+        Number of padding cells around mesh
+    exact_band : int, default=1
+        Distance band for exact computation
+    backend : str, default="auto"
+        Hardware backend: "auto", "cpu", or "gpu"
+    num_threads : int, default=0
+        Number of CPU threads (0 = auto-detect)
+    bounds : tuple, optional
+        Known mesh bounds ((min_x, min_y, min_z), (max_x, max_y, max_z)),
+        e.g. as returned by load_mesh. Skips the pass over the vertices
+        that would otherwise compute them.
+    reorder : bool, default=False
+        Sort triangles and vertices for spatial locality before generation
+        (see Session.reorder). Helps large meshes stored in arbitrary order.
+    out : ndarray, optional
+        C-contiguous float32 buffer to write the SDF into, e.g. one reused
+        across calls. Its shape must match the computed grid.
+    dtype : str, default="float32"
+        "float32", "float16" or "uint8". For uint8 the values are quantized
+        over the grid's range and metadata gains "scale" and "offset"
+        (sdf ~= quantized * scale + offset).
+    method : str, default="fh"
+        Far-field method on the CPU: "fh" (feature transform) or "sweep"
+        (fast sweeping, slower and slightly more accurate far from the mesh)
+
+    Returns
+    -------
+    sdf : ndarray, shape (nx, ny, nz), dtype float32 (or dtype)
+        Signed distance field (out, if given)
+    metadata : dict
+        Dictionary with keys: origin, dx, bounds, backend (plus scale and
+        offset for uint8)
+
+    Examples
+    --------
+    >>> vertices, triangles, bounds = sdfgen.load_mesh("mesh.obj")
+    >>> for n in (32, 64, 128):
+    ...     sdf, meta = sdfgen.generate_from_mesh(vertices, triangles, nx=n, bounds=bounds)
+    """
+    vertices = _as_mesh_array(vertices, np.float32, "vertices")
+    triangles = _as_mesh_array(triangles, np.uint32, "triangles")
+
+    with Session(vertices, triangles) as session:
+        # Bounds are computed in a single pass over the vertices unless given
+        if bounds is None:
+            bounds = session.bounds
+
+        if reorder:
+            session.reorder()
+
+        return _generate_from_session(
+            session, bounds, nx, ny, nz, dx, padding, exact_band, backend, num_threads, out, dtype,
+            method,
+        )
+
+
 def generate_from_file(
     filename: str,
     nx: Optional[int] = None,
@@ -152,12 +514,19 @@ def generate_from_file(
     exact_band: int = 1,
     backend: str = "auto",
     num_threads: int = 0,
+    reorder: bool = False,
+    out: Optional[np.ndarray] = None,
+    dtype: str = "float32",
+    method: str = "fh",
+    cache_dir: Optional[str] = None,
 ) -> Tuple[np.ndarray, dict]:
     """
     Generate SDF directly from a mesh file.
 
     This is a high-level convenience function that combines mesh loading
-    and SDF generation into a single call.
+    and SDF generation into a single call. The loaded mesh is cached per
+    file (keyed by path, modification time and size), so calling it again
+    on the same file with a different resolution skips reloading the mesh.
 
     Parameters
     ----------
@@ -181,13 +550,33 @@ def generate_from_file(
         Hardware backend: "auto", "cpu", or "gpu"
     num_threads : int, default=0
         Number of CPU threads (0 = auto-detect)
+    reorder : bool, default=False
+        Sort triangles and vertices for spatial locality after loading
+        (see Session.reorder). The reordered mesh is cached as well.
+    out : ndarray, optional
+        C-contiguous float32 buffer to write the SDF into, e.g. one reused
+        across calls. Its shape must match the computed grid.
+    dtype : str, default="float32"
+        "float32", "float16" or "uint8". For uint8 the values are quantized
+        over the grid's range and metadata gains "scale" and "offset"
+        (sdf ~= quantized * scale + offset).
+    method : str, default="fh"
+        Far-field method on the CPU: "fh" (feature transform) or "sweep"
+        (fast sweeping, slower and slightly more accurate far from the mesh)
+    cache_dir : str, optional
+        Directory of a disk cache for the result, keyed by the file's
+        contents and the grid parameters (not num_threads). A hit skips
+        loading the mesh and generation, and returns the cached grid
+        memory-mapped when dtype is "float32". The directory is created if
+        needed; entries are never evicted.
 
     Returns
     -------
-    sdf : ndarray, shape (nx, ny, nz), dtype float32
-        Signed distance field
+    sdf : ndarray, shape (nx, ny, nz), dtype float32 (or dtype)
+        Signed distance field (out, if given)
     metadata : dict
-        Dictionary with keys: origin, dx, bounds, backend
+        Dictionary with keys: origin, dx, bounds, backend (plus scale and
+        offset for uint8)
 
     Examples
     --------
@@ -199,81 +588,130 @@ def generate_from_file(
     >>>
     >>> # Using cell size (like CLI)
     >>> sdf, meta = sdfgen.generate_from_file("mesh.obj", dx=0.01, padding=2)
+    >>>
+    >>> # Reuse results across runs, e.g. when rebuilding a training set
+    >>> sdf, meta = sdfgen.generate_from_file("mesh.obj", nx=128, cache_dir="sdf_cache")
     """
-    # Load mesh
-    vertices, triangles, bounds = load_mesh(filename)
-    min_box = np.array(bounds[0], dtype=np.float32)
-    max_box = np.array(bounds[1], dtype=np.float32)
-    extents = max_box - min_box
-
-    # Determine grid sizing mode
-    if dx is not None:
-        # Mode 1: Use cell size (like CLI for OBJ)
-        if nx is None:
-            nx = int(np.ceil(extents[0] / dx))
-        if ny is None:
-            ny = int(np.ceil(extents[1] / dx))
-        if nz is None:
-            nz = int(np.ceil(extents[2] / dx))
-    elif nx is not None:
-        # Mode 2: Use grid dimensions
-        if ny is None or nz is None:
-            # Proportional sizing
-            if dx is None:
-                dx = extents[0] / nx
-            ny = int(np.ceil(extents[1] / dx)) if ny is None else ny
-            nz = int(np.ceil(extents[2] / dx)) if nz is None else nz
-        else:
-            # Manual sizing - compute dx from largest dimension
-            if dx is None:
-                dx = max(extents[0] / nx, extents[1] / ny, extents[2] / nz)
-    else:
+    if dx is None and nx is None:
         raise ValueError(
             "Must specify either 'dx' or 'nx' (or 'nx', 'ny', 'nz') for grid sizing"
         )
 
-    # Add padding
-    nx += 2 * padding
-    ny += 2 * padding
-    nz += 2 * padding
+    def generate(out, dtype):
+        # Load mesh straight into a session. Sessions are cached per file, so
+        # repeated calls on an unchanged file (e.g. a resolution sweep) skip loading.
+        stat = os.stat(filename)
+        session = _cached_session(
+            os.path.abspath(filename), stat.st_mtime_ns, stat.st_size, reorder
+        )
 
-    # Adjust origin for padding
-    origin = min_box - padding * dx
+        return _generate_from_session(
+            session, session.bounds, nx, ny, nz, dx, padding, exact_band, backend, num_threads,
+            out, dtype, method,
+        )
 
-    # Generate SDF
-    sdf = generate_sdf(
-        vertices,
-        triangles,
-        tuple(origin),
-        dx,
-        nx,
-        ny,
-        nz,
-        exact_band=exact_band,
-        backend=backend,
-        num_threads=num_threads,
-    )
+    if cache_dir is None:
+        return generate(out, dtype)
 
-    # Prepare metadata
-    metadata = {
-        "origin": tuple(origin),
-        "dx": dx,
-        "bounds": (tuple(min_box), tuple(max_box)),
-        "backend": backend,
+    # The cache holds float32 grids; other dtypes are converted from them
+    params = {
+        "nx": nx, "ny": ny, "nz": nz, "dx": dx, "padding": padding, "exact_band": exact_band,
+        "backend": backend, "reorder": reorder, "method": method, "version": __version__,
     }
+    sdf, metadata = _cached_generate(
+        cache_dir, filename, params, lambda: generate(None, "float32")
+    )
+    return _convert_sdf(sdf, metadata, out, dtype)
 
-    return sdf, metadata
+
+def generate_batch(
+    filenames: Sequence[str],
+    nx: Optional[int] = None,
+    ny: Optional[int] = None,
+    nz: Optional[int] = None,
+    dx: Optional[float] = None,
+    padding: int = 1,
+    exact_band: int = 1,
+    backend: str = "auto",
+    num_threads: int = 1,
+    workers: int = 0,
+    reorder: bool = False,
+    dtype: str = "float32",
+    method: str = "fh",
+    cache_dir: Optional[str] = None,
+) -> List[Tuple[np.ndarray, dict]]:
+    """
+    Generate SDFs for several mesh files in parallel.
+
+    Each file is processed by generate_from_file on a thread pool. Mesh
+    loading, SDF generation and file I/O release the GIL, so the files are
+    baked concurrently. Many small meshes scale better this way than with
+    the threads of a single generate_from_file call.
+
+    Parameters
+    ----------
+    filenames : sequence of str
+        Paths to mesh files (.obj or .stl)
+    nx, ny, nz, dx, padding, exact_band, backend, reorder, dtype, method, cache_dir
+        Same as generate_from_file, applied to every file
+    num_threads : int, default=1
+        Number of CPU threads per file (0 = auto-detect). The default of one
+        keeps workers * num_threads within the number of cores.
+    workers : int, default=0
+        Number of files processed at once (0 = number of CPUs)
+
+    Returns
+    -------
+    results : list of (sdf, metadata)
+        One entry per file, in the order of filenames
+
+    Examples
+    --------
+    >>> results = sdfgen.generate_batch(["a.stl", "b.stl", "c.obj"], nx=64)
+    >>> for (sdf, meta), name in zip(results, ["a", "b", "c"]):
+    ...     sdfgen.save_sdf(name + ".sdf", sdf, meta["origin"], meta["dx"])
+    """
+    if dx is None and nx is None:
+        raise ValueError(
+            "Must specify either 'dx' or 'nx' (or 'nx', 'ny', 'nz') for grid sizing"
+        )
+
+    if workers < 0:
+        raise ValueError("workers must be non-negative")
+
+    filenames = list(filenames)
+    if not filenames:
+        return []
+
+    workers = min(workers or os.cpu_count() or 1, len(filenames))
+
+    def generate(filename):
+        return generate_from_file(
+            filename, nx=nx, ny=ny, nz=nz, dx=dx, padding=padding,
+            exact_band=exact_band, backend=backend, num_threads=num_threads,
+            reorder=reorder, dtype=dtype, method=method, cache_dir=cache_dir,
+        )
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(generate, filenames))
 
 
 # Export public API
 __all__ = [
     # Core functions from C++ extension
     "load_mesh",
+    "compute_bounds",
     "generate_sdf",
     "save_sdf",
-    "load_sdf",
+    "read_sdf_header",
+    "quantize_sdf",
     "is_gpu_available",
+    "is_zstd_available",
+    "Session",
     # High-level Python convenience functions
+    "load_sdf",
     "generate_from_mesh",
     "generate_from_file",
+    "generate_batch",
+    "generate_sdf_chunked",
 ]
@@ -7,9 +7,14 @@
 #include <nanobind/stl/string.h>
 #include <nanobind/stl/vector.h>
 #include <nanobind/stl/tuple.h>
+#include <nanobind/stl/optional.h>
+
+#include <algorithm>
+#include <cstring>
 
 #include "../common/sdfgen_unified.h"
 #include "../common/mesh_io.h"
+#include "../common/mesh_reorder.h"
 #include "../common/sdf_io.h"
 #include "../common/array3.h"
 #include "../common/vec.h"
@@ -17,6 +22,12 @@
 namespace nb = nanobind;
 using namespace nb::literals;
 
+static_assert(sizeof(Vec3f) == 3 * sizeof(float), "Vec3f must be three packed floats");
+static_assert(sizeof(Vec3ui) == 3 * sizeof(uint32_t), "Vec3ui must be three packed uint32 values");
+
+// Caller-provided C-ordered float32 grid the SDF is written into
+using SdfBuffer = nb::ndarray<float, nb::ndim<3>, nb::c_contig, nb::device::cpu>;
+
 /**
  * @brief Convert NumPy array of float32 vertices to C++ vector
  *
@@ -26,13 +37,13 @@ using namespace nb::literals;
  * @param arr NumPy ndarray with shape (N, 3) and dtype float32, C-contiguous
  * @return std::vector containing N Vec3f vertex positions
  */
-std::vector<Vec3f> numpy_to_vec3f(nb::ndarray<float, nb::shape<-1, 3>, nb::c_contig> arr) {
+std::vector<Vec3f> numpy_to_vec3f(nb::ndarray<float, nb::shape<-1, 3>, nb::c_contig, nb::device::cpu> arr) {
     size_t n = arr.shape(0);
     std::vector<Vec3f> result(n);
 
-    auto data = arr.data();
-    for (size_t i = 0; i < n; ++i) {
-        result[i] = Vec3f(data[i * 3 + 0], data[i * 3 + 1], data[i * 3 + 2]);
+    // Vec3f is three packed floats, so the rows can be copied as one block
+    if (n > 0) {
+        std::memcpy(result.data(), arr.data(), n * sizeof(Vec3f));
     }
 
     return result;
@@ -47,18 +58,58 @@ std::vector<Vec3f> numpy_to_vec3f(nb::ndarray<float, nb::shape<-1, 3>, nb::c_con
  * @param arr NumPy ndarray with shape (M, 3) and dtype uint32, C-contiguous
  * @return std::vector containing M Vec3ui triangle index triples
  */
-std::vector<Vec3ui> numpy_to_vec3ui(nb::ndarray<uint32_t, nb::shape<-1, 3>, nb::c_contig> arr) {
+std::vector<Vec3ui> numpy_to_vec3ui(nb::ndarray<uint32_t, nb::shape<-1, 3>, nb::c_contig, nb::device::cpu> arr) {
     size_t n = arr.shape(0);
     std::vector<Vec3ui> result(n);
 
-    auto data = arr.data();
-    for (size_t i = 0; i < n; ++i) {
-        result[i] = Vec3ui(data[i * 3 + 0], data[i * 3 + 1], data[i * 3 + 2]);
+    // Vec3ui is three packed uint32 indices, so the rows can be copied as one block
+    if (n > 0) {
+        std::memcpy(result.data(), arr.data(), n * sizeof(Vec3ui));
     }
 
     return result;
 }
 
+/**
+ * @brief Copy slices [i_begin, i_end) of a C++ Array3f SDF grid into a C-ordered buffer
+ *
+ * Array3f stores i fastest and k slowest, while NumPy arrays of shape (ni, nj, nk)
+ * store k fastest. This transposes the selected slices into that C-order layout.
+ *
+ * @param arr Input Array3f signed distance field with dimensions ni x nj x nk
+ * @param data Destination buffer of (i_end - i_begin) * nj * nk floats in C-order
+ * @param i_begin First i slice to copy
+ * @param i_end One past the last i slice to copy
+ */
+template <typename T, typename Convert>
+void copy_array3f(const Array3f& arr, T* data, int i_begin, int i_end, Convert convert) {
+    size_t nj = arr.nj;
+    size_t nk = arr.nk;
+
+    // Copy data from Array3f (i, j, k indexing)
+    for (int i = i_begin; i < i_end; ++i) {
+        T* slice = data + (size_t)(i - i_begin) * nj * nk;
+        for (size_t j = 0; j < nj; ++j) {
+            for (size_t k = 0; k < nk; ++k) {
+                slice[j * nk + k] = convert(arr(i, j, k));
+            }
+        }
+    }
+}
+
+void copy_array3f(const Array3f& arr, float* data, int i_begin, int i_end) {
+    copy_array3f(arr, data, i_begin, i_end, [](float v) { return v; });
+}
+
+// NumPy dtype descriptor for a storage dtype
+nb::dlpack::dtype to_dlpack_dtype(SdfDtype dtype) {
+    switch (dtype) {
+        case SdfDtype::Float16: return {(uint8_t)nb::dlpack::dtype_code::Float, 16, 1};
+        case SdfDtype::UInt8: return nb::dtype<uint8_t>();
+        default: return nb::dtype<float>();
+    }
+}
+
 /**
  * @brief Convert C++ Array3f SDF grid to NumPy array
  *
@@ -75,15 +126,7 @@ nb::ndarray<nb::numpy, float> array3f_to_numpy(const Array3f& arr) {
 
     // Create numpy array with shape (ni, nj, nk)
     float* data = new float[ni * nj * nk];
-
-    // Copy data from Array3f (i, j, k indexing)
-    for (size_t i = 0; i < ni; ++i) {
-        for (size_t j = 0; j < nj; ++j) {
-            for (size_t k = 0; k < nk; ++k) {
-                data[i * nj * nk + j * nk + k] = arr(i, j, k);
-            }
-        }
-    }
+    copy_array3f(arr, data, 0, arr.ni);
 
     // Create capsule for memory management
     nb::capsule owner(data, [](void* p) noexcept {
@@ -97,13 +140,111 @@ nb::ndarray<nb::numpy, float> array3f_to_numpy(const Array3f& arr) {
     );
 }
 
+/**
+ * @brief Convert C++ Array3f SDF grid to a float16 NumPy array
+ *
+ * Same as array3f_to_numpy(), but rounds each value to half precision while
+ * transposing, so no float32 copy of the grid is made.
+ *
+ * @param arr Input Array3f signed distance field with dimensions ni x nj x nk
+ * @return NumPy ndarray with shape (ni, nj, nk), dtype float16, C-contiguous
+ */
+nb::ndarray<nb::numpy> array3f_to_numpy_half(const Array3f& arr) {
+    size_t ni = arr.ni;
+    size_t nj = arr.nj;
+    size_t nk = arr.nk;
+
+    uint16_t* data = new uint16_t[ni * nj * nk];
+    copy_array3f(arr, data, 0, arr.ni, float_to_half);
+
+    nb::capsule owner(data, [](void* p) noexcept {
+        delete[] static_cast<uint16_t*>(p);
+    });
+
+    size_t shape[3] = {ni, nj, nk};
+
+    return nb::ndarray<nb::numpy>(
+        data, 3, shape, owner, nullptr, to_dlpack_dtype(SdfDtype::Float16)
+    );
+}
+
+// Parse backend name into the unified API enum
+sdfgen::HardwareBackend parse_backend(const std::string& backend) {
+    if (backend == "cpu") {
+        return sdfgen::HardwareBackend::CPU;
+    } else if (backend == "gpu") {
+        return sdfgen::HardwareBackend::GPU;
+    } else if (backend != "auto") {
+        throw std::invalid_argument("Invalid backend: " + backend + " (must be 'auto', 'cpu', or 'gpu')");
+    }
+    return sdfgen::HardwareBackend::Auto;
+}
+
+// Parse far-field method name into the unified API enum
+sdfgen::FarFieldMethod parse_method(const std::string& method) {
+    if (method == "fh") {
+        return sdfgen::FarFieldMethod::FeatureTransform;
+    } else if (method != "sweep") {
+        throw std::invalid_argument("Invalid method: " + method + " (must be 'fh' or 'sweep')");
+    }
+    return sdfgen::FarFieldMethod::Sweep;
+}
+
+// Parse optional compression name into the SDF file format enum
+SdfCompression parse_compression(const std::optional<std::string>& compress) {
+    if (!compress) {
+        return SdfCompression::None;
+    } else if (*compress != "zstd") {
+        throw std::invalid_argument("Invalid compression: " + *compress + " (must be None or 'zstd')");
+    } else if (!sdf_compression_available(SdfCompression::Zstd)) {
+        throw std::runtime_error("zstd compression is not available (SDFGen was built without zstd)");
+    }
+    return SdfCompression::Zstd;
+}
+
+// Parse storage dtype name into the SDF file format enum
+SdfDtype parse_dtype(const std::string& dtype) {
+    if (dtype == "float32") {
+        return SdfDtype::Float32;
+    } else if (dtype == "float16") {
+        return SdfDtype::Float16;
+    } else if (dtype != "uint8") {
+        throw std::invalid_argument("Invalid dtype: " + dtype + " (must be 'float32', 'float16', or 'uint8')");
+    }
+    return SdfDtype::UInt8;
+}
+
+// Validate grid parameters shared by all generation entry points
+void validate_grid(int nx, int ny, int nz, float dx) {
+    if (nx <= 0 || ny <= 0 || nz <= 0) {
+        throw std::invalid_argument("Grid dimensions must be positive (nx, ny, nz > 0)");
+    }
+
+    if (dx <= 0.0f) {
+        throw std::invalid_argument("Cell spacing dx must be positive");
+    }
+}
+
+// Convert (x, y, z) tuple to Vec3f
+Vec3f tuple_to_vec3f(nb::tuple t) {
+    return Vec3f(
+        nb::cast<float>(t[0]),
+        nb::cast<float>(t[1]),
+        nb::cast<float>(t[2])
+    );
+}
+
 // Load mesh from file
 nb::tuple load_mesh(const std::string& filename) {
     std::vector<Vec3f> vertices;
     std::vector<Vec3ui> triangles;
     Vec3f min_box, max_box;
+    bool success;
 
-    bool success = meshio::load_mesh(filename.c_str(), vertices, triangles, min_box, max_box);
+    {
+        nb::gil_scoped_release release;
+        success = meshio::load_mesh(filename.c_str(), vertices, triangles, min_box, max_box);
+    }
 
     if (!success) {
         throw std::runtime_error("Failed to load mesh: " + filename);
@@ -156,65 +297,266 @@ nb::tuple load_mesh(const std::string& filename) {
     return nb::make_tuple(vert_array, tri_array, bounds);
 }
 
-// Generate SDF from numpy arrays
-nb::ndarray<nb::numpy, float> generate_sdf(
-    nb::ndarray<float, nb::shape<-1, 3>, nb::c_contig> vertices,
-    nb::ndarray<uint32_t, nb::shape<-1, 3>, nb::c_contig> triangles,
-    nb::tuple origin,
-    float dx,
-    int nx, int ny, int nz,
-    int exact_band = 1,
-    const std::string& backend = "auto",
-    int num_threads = 0
-) {
-    // Validate mesh is not empty
-    if (vertices.shape(0) == 0 || triangles.shape(0) == 0) {
-        throw std::invalid_argument("Cannot generate SDF from empty mesh (vertices or triangles are empty)");
+// Compute mesh bounding box directly from the numpy vertex buffer
+nb::tuple compute_bounds(nb::ndarray<float, nb::shape<-1, 3>, nb::c_contig, nb::device::cpu> vertices) {
+    if (vertices.shape(0) == 0) {
+        throw std::invalid_argument("Cannot compute bounds of an empty vertex array");
     }
 
-    // Validate grid parameters
-    if (nx <= 0 || ny <= 0 || nz <= 0) {
-        throw std::invalid_argument("Grid dimensions must be positive (nx, ny, nz > 0)");
+    Vec3f min_box, max_box;
+    meshio::compute_bounds(vertices.data(), vertices.shape(0), min_box, max_box);
+
+    return nb::make_tuple(
+        nb::make_tuple(min_box[0], min_box[1], min_box[2]),
+        nb::make_tuple(max_box[0], max_box[1], max_box[2])
+    );
+}
+
+/**
+ * @brief Mesh held in native C++ layout for repeated SDF generation
+ *
+ * Converts the NumPy vertex and triangle arrays once (or loads them straight from
+ * a mesh file) and keeps them alive for the lifetime of the session, so that
+ * generating several grids or many slabs of one grid does not repeat the
+ * conversion for every call. Usable as a Python context manager; leaving the
+ * context releases the mesh buffers.
+ */
+class Session {
+public:
+    Session(nb::ndarray<float, nb::shape<-1, 3>, nb::c_contig, nb::device::cpu> vertices,
+            nb::ndarray<uint32_t, nb::shape<-1, 3>, nb::c_contig, nb::device::cpu> triangles) {
+        if (vertices.shape(0) == 0 || triangles.shape(0) == 0) {
+            throw std::invalid_argument("Cannot generate SDF from empty mesh (vertices or triangles are empty)");
+        }
+
+        verts = numpy_to_vec3f(vertices);
+        tris = numpy_to_vec3ui(triangles);
+        check_indices();
     }
 
-    if (dx <= 0.0f) {
-        throw std::invalid_argument("Cell spacing dx must be positive");
+    // Load the mesh directly into the session, skipping the NumPy round trip
+    static Session from_file(const std::string& filename) {
+        Session session;
+        bool success;
+
+        {
+            nb::gil_scoped_release release;
+            success = meshio::load_mesh(filename.c_str(), session.verts, session.tris,
+                                        session.min_box, session.max_box);
+        }
+
+        if (!success) {
+            throw std::runtime_error("Failed to load mesh: " + filename);
+        }
+
+        if (session.verts.empty() || session.tris.empty()) {
+            throw std::invalid_argument("Cannot generate SDF from empty mesh (vertices or triangles are empty)");
+        }
+
+        session.check_indices();
+        session.has_bounds = true;
+        return session;
     }
 
-    // Convert inputs
-    auto verts = numpy_to_vec3f(vertices);
-    auto tris = numpy_to_vec3ui(triangles);
+    // Generate the SDF of a full grid, into out when given
+    nb::ndarray<nb::numpy> generate_sdf(
+        nb::tuple origin,
+        float dx,
+        int nx, int ny, int nz,
+        int exact_band,
+        const std::string& backend,
+        int num_threads,
+        std::optional<SdfBuffer> out,
+        const std::string& dtype,
+        const std::string& method
+    ) {
+        check_open();
+        validate_grid(nx, ny, nz, dx);
+
+        SdfDtype sdf_dtype = parse_dtype(dtype);
+        if (sdf_dtype == SdfDtype::UInt8) {
+            throw std::invalid_argument("dtype 'uint8' needs a scale and offset; use quantize_sdf on the float32 result");
+        }
 
-    Vec3f origin_vec(
-        nb::cast<float>(origin[0]),
-        nb::cast<float>(origin[1]),
-        nb::cast<float>(origin[2])
-    );
+        if (out && sdf_dtype != SdfDtype::Float32) {
+            throw std::invalid_argument("Output buffer is only supported for dtype 'float32'");
+        }
 
-    // Parse backend
-    sdfgen::HardwareBackend hw_backend = sdfgen::HardwareBackend::Auto;
-    if (backend == "cpu") {
-        hw_backend = sdfgen::HardwareBackend::CPU;
-    } else if (backend == "gpu") {
-        hw_backend = sdfgen::HardwareBackend::GPU;
-    } else if (backend != "auto") {
-        throw std::invalid_argument("Invalid backend: " + backend + " (must be 'auto', 'cpu', or 'gpu')");
+        if (out && (out->shape(0) != (size_t)nx || out->shape(1) != (size_t)ny || out->shape(2) != (size_t)nz)) {
+            throw std::invalid_argument("Output buffer shape must be (nx, ny, nz)");
+        }
+
+        Vec3f origin_vec = tuple_to_vec3f(origin);
+        sdfgen::HardwareBackend hw = parse_backend(backend);
+        sdfgen::FarFieldMethod far_field = parse_method(method);
+
+        // The kernel only touches C++ data, so other Python threads can run
+        Array3f phi;
+        {
+            nb::gil_scoped_release release;
+            sdfgen::make_level_set3(
+                tris, verts,
+                origin_vec, dx,
+                nx, ny, nz,
+                phi,
+                exact_band,
+                hw,
+                num_threads,
+                far_field
+            );
+        }
+
+        if (out) {
+            copy_array3f(phi, out->data(), 0, nx);
+            return nb::ndarray<nb::numpy>(*out);
+        }
+
+        if (sdf_dtype == SdfDtype::Float16) {
+            return array3f_to_numpy_half(phi);
+        }
+
+        return nb::ndarray<nb::numpy>(array3f_to_numpy(phi));
     }
 
-    // Generate SDF
-    Array3f phi;
-    sdfgen::make_level_set3(
-        tris, verts,
-        origin_vec, dx,
-        nx, ny, nz,
-        phi,
-        exact_band,
-        hw_backend,
-        num_threads
-    );
+    /**
+     * @brief Generate the SDF for grid slices x0 <= i < x1 into a caller buffer
+     *
+     * The slab is computed as its own grid whose origin is shifted to its first
+     * slice. Triangles outside the slab still seed the cells on its boundary, and
+     * crossings on the -x side are counted into the first interval, so the
+     * signs match those of the full grid. One halo slice is added on each side
+     * (where the grid has one) so that even single-slice slabs get swept.
+     * out[i - x0, j, k] receives cell (i, j, k).
+     */
+    void generate_slab(
+        nb::tuple origin,
+        float dx,
+        int nx, int ny, int nz,
+        int x0, int x1,
+        SdfBuffer out,
+        int exact_band,
+        const std::string& backend,
+        int num_threads,
+        const std::string& method
+    ) {
+        check_open();
+        validate_grid(nx, ny, nz, dx);
+
+        if (x0 < 0 || x1 > nx || x0 >= x1) {
+            throw std::invalid_argument("Slab range must satisfy 0 <= x0 < x1 <= nx");
+        }
+
+        if (out.shape(0) != (size_t)(x1 - x0) || out.shape(1) != (size_t)ny || out.shape(2) != (size_t)nz) {
+            throw std::invalid_argument("Output buffer shape must be (x1 - x0, ny, nz)");
+        }
+
+        // Extend the slab by the halo slices
+        int h0 = std::max(x0 - 1, 0);
+        int h1 = std::min(x1 + 1, nx);
+
+        Vec3f origin_vec = tuple_to_vec3f(origin);
+
+        sdfgen::HardwareBackend hw = parse_backend(backend);
+        sdfgen::FarFieldMethod far_field = parse_method(method);
+
+        Array3f phi;
+        {
+            nb::gil_scoped_release release;
+            sdfgen::make_level_set3(
+                tris, verts,
+                origin_vec, dx,
+                h1 - h0, ny, nz,
+                phi,
+                exact_band,
+                hw,
+                num_threads,
+                far_field,
+                nx, h0
+            );
+            copy_array3f(phi, out.data(), x0 - h0, x1 - h0);
+        }
+    }
+
+    // Sort triangles and vertices for spatial locality (bounds are unchanged)
+    void reorder() {
+        check_open();
+        meshio::reorder_for_locality(verts, tris);
+    }
+
+    // Release the mesh buffers (called on context exit)
+    void close() {
+        std::vector<Vec3f>().swap(verts);
+        std::vector<Vec3ui>().swap(tris);
+    }
+
+    // Mesh bounding box, computed on first use unless the loader provided it
+    nb::tuple bounds() {
+        check_open();
+
+        if (!has_bounds) {
+            meshio::compute_bounds(&verts[0][0], verts.size(), min_box, max_box);
+            has_bounds = true;
+        }
+
+        return nb::make_tuple(
+            nb::make_tuple(min_box[0], min_box[1], min_box[2]),
+            nb::make_tuple(max_box[0], max_box[1], max_box[2])
+        );
+    }
+
+    size_t num_vertices() const { return verts.size(); }
+    size_t num_triangles() const { return tris.size(); }
+
+private:
+    Session() = default;
+
+    void check_open() const {
+        if (verts.empty()) {
+            throw std::runtime_error("Session is closed");
+        }
+    }
+
+    // Indices past the vertex buffer would be read unchecked by the kernels and by
+    // reorder(). The check runs once per session, on the copy that is still in cache,
+    // so repeated generation from one session does not rescan the triangles.
+    void check_indices() const {
+        uint32_t max_index = 0;
+        for (const Vec3ui& t : tris) {
+            max_index = std::max(max_index, std::max(t[0], std::max(t[1], t[2])));
+        }
+
+        if (max_index >= verts.size()) {
+            throw std::invalid_argument(
+                "Triangle index " + std::to_string(max_index) + " out of range for " +
+                std::to_string(verts.size()) + " vertices"
+            );
+        }
+    }
 
-    // Convert to numpy
-    return array3f_to_numpy(phi);
+    std::vector<Vec3f> verts;
+    std::vector<Vec3ui> tris;
+    Vec3f min_box, max_box;
+    bool has_bounds = false;
+};
+
+// Generate SDF from numpy arrays
+nb::ndarray<nb::numpy> generate_sdf(
+    nb::ndarray<float, nb::shape<-1, 3>, nb::c_contig, nb::device::cpu> vertices,
+    nb::ndarray<uint32_t, nb::shape<-1, 3>, nb::c_contig, nb::device::cpu> triangles,
+    nb::tuple origin,
+    float dx,
+    int nx, int ny, int nz,
+    int exact_band = 1,
+    const std::string& backend = "auto",
+    int num_threads = 0,
+    std::optional<SdfBuffer> out = std::nullopt,
+    const std::string& dtype = "float32",
+    const std::string& method = "fh"
+) {
+    // One-shot session: converts the mesh, validates inputs and generates
+    return Session(vertices, triangles).generate_sdf(
+        origin, dx, nx, ny, nz, exact_band, backend, num_threads, out, dtype, method
+    );
 }
 
 // Save SDF to binary file
@@ -222,8 +564,13 @@ void save_sdf(
     const std::string& filename,
     nb::ndarray<float, nb::shape<-1, -1, -1>, nb::c_contig> sdf_array,
     nb::tuple origin,
-    float dx
+    float dx,
+    const std::string& dtype = "float32",
+    std::optional<std::string> compress = std::nullopt
 ) {
+    SdfDtype sdf_dtype = parse_dtype(dtype);
+    SdfCompression compression = parse_compression(compress);
+
     // Validate array dimensions
     if (sdf_array.ndim() != 3) {
         throw std::invalid_argument("SDF array must be 3-dimensional");
@@ -238,73 +585,127 @@ void save_sdf(
         throw std::invalid_argument("SDF array dimensions cannot be zero");
     }
 
-    // Convert numpy array to Array3f
-    Array3f phi(nx, ny, nz);
-    auto data = sdf_array.data();
-
-    for (size_t i = 0; i < nx; ++i) {
-        for (size_t j = 0; j < ny; ++j) {
-            for (size_t k = 0; k < nz; ++k) {
-                phi(i, j, k) = data[i * ny * nz + j * nz + k];
-            }
-        }
-    }
-
     Vec3f origin_vec(
         nb::cast<float>(origin[0]),
         nb::cast<float>(origin[1]),
         nb::cast<float>(origin[2])
     );
 
-    // Compute bounds
-    Vec3f max_box(
-        origin_vec[0] + dx * nx,
-        origin_vec[1] + dx * ny,
-        origin_vec[2] + dx * nz
-    );
-
-    // Compute dx from the metadata
-    // Save using existing I/O function
-    bool success = write_sdf_binary(
-        filename,
-        phi,
-        origin_vec,
-        dx
-    );
+    // The array is already in the file's C-order, so it is written as is
+    bool success;
+    {
+        nb::gil_scoped_release release;
+        success = write_sdf_data(
+            filename,
+            sdf_array.data(),
+            (int)nx, (int)ny, (int)nz,
+            origin_vec,
+            dx,
+            sdf_dtype,
+            compression
+        );
+    }
 
     if (!success) {
         throw std::runtime_error("Failed to write SDF file: " + filename);
     }
 }
 
+// Quantize a float32 SDF to float16 or uint8 in a single pass
+nb::tuple quantize(
+    nb::ndarray<float, nb::c_contig, nb::device::cpu> sdf_array,
+    const std::string& dtype
+) {
+    SdfDtype sdf_dtype = parse_dtype(dtype);
+
+    std::vector<size_t> shape(sdf_array.ndim());
+    for (size_t d = 0; d < shape.size(); ++d) {
+        shape[d] = sdf_array.shape(d);
+    }
+
+    size_t count = sdf_array.size();
+    uint8_t* data = new uint8_t[std::max<size_t>(count, 1) * sdf_dtype_size(sdf_dtype)];
+    nb::capsule owner(data, [](void* p) noexcept {
+        delete[] static_cast<uint8_t*>(p);
+    });
+
+    float scale, offset;
+    quantize_sdf(sdf_array.data(), count, sdf_dtype, data, scale, offset);
+
+    auto q_array = nb::ndarray<nb::numpy>(
+        data, shape.size(), shape.data(), owner, nullptr, to_dlpack_dtype(sdf_dtype)
+    );
+
+    return nb::make_tuple(q_array, scale, offset);
+}
+
+// Grid origin, spacing and bounds from an SDF file header
+nb::tuple sdf_file_metadata(const SdfFileInfo& info) {
+    float dx = (info.max_box[0] - info.min_box[0]) / info.dims[0];
+    auto origin = nb::make_tuple(info.min_box[0], info.min_box[1], info.min_box[2]);
+    auto bounds = nb::make_tuple(
+        nb::make_tuple(info.min_box[0], info.min_box[1], info.min_box[2]),
+        nb::make_tuple(info.max_box[0], info.max_box[1], info.max_box[2])
+    );
+
+    return nb::make_tuple(origin, dx, bounds);
+}
+
 // Load SDF from binary file
 nb::tuple load_sdf(const std::string& filename) {
-    Array3f phi;
-    Vec3f min_box, max_box;
+    SdfFileInfo info;
+    auto* values = new std::vector<float>();
+    bool success;
 
-    bool success = read_sdf_binary(
-        filename,
-        phi,
-        min_box,
-        max_box
-    );
+    {
+        nb::gil_scoped_release release;
+        success = read_sdf_data(filename, info, *values);
+    }
 
     if (!success) {
+        delete values;
         throw std::runtime_error("Failed to read SDF file: " + filename);
     }
 
-    // Convert to numpy
-    auto sdf_array = array3f_to_numpy(phi);
+    // The file stores C-order values, so the buffer is handed to NumPy as is
+    nb::capsule owner(values, [](void* p) noexcept {
+        delete static_cast<std::vector<float>*>(p);
+    });
 
-    // Compute metadata
-    float dx = (max_box[0] - min_box[0]) / phi.ni;
-    auto origin = nb::make_tuple(min_box[0], min_box[1], min_box[2]);
-    auto bounds = nb::make_tuple(
-        nb::make_tuple(min_box[0], min_box[1], min_box[2]),
-        nb::make_tuple(max_box[0], max_box[1], max_box[2])
-    );
+    size_t shape[3] = {(size_t)info.dims[0], (size_t)info.dims[1], (size_t)info.dims[2]};
+    auto sdf_array = nb::ndarray<nb::numpy, float>(values->data(), 3, shape, owner);
 
-    return nb::make_tuple(sdf_array, origin, dx, bounds);
+    nb::tuple metadata = sdf_file_metadata(info);
+    return nb::make_tuple(sdf_array, metadata[0], metadata[1], metadata[2]);
+}
+
+// Read the header of an SDF file without loading its values
+nb::dict read_sdf_header(const std::string& filename) {
+    SdfFileInfo info;
+
+    if (!read_sdf_info(filename, info)) {
+        throw std::runtime_error("Failed to read SDF file: " + filename);
+    }
+
+    static const char* dtype_names[] = {"float32", "float16", "uint8"};
+    nb::tuple metadata = sdf_file_metadata(info);
+
+    nb::dict header;
+    header["shape"] = nb::make_tuple(info.dims[0], info.dims[1], info.dims[2]);
+    header["origin"] = metadata[0];
+    header["dx"] = metadata[1];
+    header["bounds"] = metadata[2];
+    header["dtype"] = dtype_names[(int)info.dtype];
+    header["scale"] = info.scale;
+    header["offset"] = info.offset;
+    header["compression"] = info.compression == SdfCompression::Zstd ? nb::object(nb::str("zstd")) : nb::none();
+    header["data_offset"] = info.data_offset;
+    return header;
+}
+
+// Query zstd availability
+bool is_zstd_available() {
+    return sdf_compression_available(SdfCompression::Zstd);
 }
 
 // Query GPU availability
@@ -334,6 +735,21 @@ NB_MODULE(sdfgen_ext, m) {
         "    ((min_x, min_y, min_z), (max_x, max_y, max_z))"
     );
 
+    m.def("compute_bounds", &compute_bounds,
+        "vertices"_a,
+        "Compute the axis-aligned bounding box of a vertex array\n\n"
+        "Traverses the vertex buffer once in C++, without the separate min and\n"
+        "max passes that vertices.min(axis=0) / vertices.max(axis=0) require.\n\n"
+        "Parameters\n"
+        "----------\n"
+        "vertices : ndarray, shape (N, 3), dtype float32\n"
+        "    Vertex positions\n\n"
+        "Returns\n"
+        "-------\n"
+        "bounds : tuple\n"
+        "    ((min_x, min_y, min_z), (max_x, max_y, max_z))"
+    );
+
     m.def("generate_sdf", &generate_sdf,
         "vertices"_a, "triangles"_a,
         "origin"_a, "dx"_a,
@@ -341,6 +757,9 @@ NB_MODULE(sdfgen_ext, m) {
         "exact_band"_a = 1,
         "backend"_a = "auto",
         "num_threads"_a = 0,
+        "out"_a.noconvert() = nb::none(),
+        "dtype"_a = "float32",
+        "method"_a = "fh",
         "Generate a signed distance field from a triangle mesh\n\n"
         "Parameters\n"
         "----------\n"
@@ -359,15 +778,113 @@ NB_MODULE(sdfgen_ext, m) {
         "backend : str, optional\n"
         "    Hardware backend: 'auto', 'cpu', or 'gpu' (default: 'auto')\n"
         "num_threads : int, optional\n"
-        "    Number of CPU threads, 0 for auto-detect (default: 0)\n\n"
+        "    Number of CPU threads, 0 for auto-detect (default: 0)\n"
+        "out : ndarray, shape (nx, ny, nz), dtype float32, optional\n"
+        "    C-contiguous buffer to write the result into instead of allocating\n"
+        "    a new array, e.g. one reused across calls (default: None)\n"
+        "dtype : str, optional\n"
+        "    'float32' or 'float16'; float16 halves the returned array\n"
+        "    (default: 'float32')\n"
+        "method : str, optional\n"
+        "    How distances are carried beyond exact_band on the CPU: 'fh'\n"
+        "    (Felzenszwalb-Huttenlocher feature transform, one triangle query\n"
+        "    per cell) or 'sweep' (fast sweeping). The GPU always sweeps\n"
+        "    (default: 'fh')\n\n"
         "Returns\n"
         "-------\n"
-        "sdf : ndarray, shape (nx, ny, nz), dtype float32\n"
-        "    Signed distance field (negative inside, positive outside, zero on surface)"
+        "sdf : ndarray, shape (nx, ny, nz), dtype float32 (or float16)\n"
+        "    Signed distance field (negative inside, positive outside, zero on surface);\n"
+        "    out itself when given"
     );
 
+    nb::class_<Session>(m, "Session",
+        "Triangle mesh prepared once for repeated SDF generation\n\n"
+        "Keeps the mesh converted to the library's native layout so that\n"
+        "generating several grids (e.g. a resolution sweep) or many slabs of\n"
+        "one grid does not repeat the conversion for every call.\n"
+        "Use as a context manager to release the mesh buffers on exit.\n\n"
+        "Parameters\n"
+        "----------\n"
+        "vertices : ndarray, shape (N, 3), dtype float32\n"
+        "    Vertex positions\n"
+        "triangles : ndarray, shape (M, 3), dtype uint32\n"
+        "    Triangle indices (zero-based)")
+        .def(nb::init<nb::ndarray<float, nb::shape<-1, 3>, nb::c_contig, nb::device::cpu>,
+                      nb::ndarray<uint32_t, nb::shape<-1, 3>, nb::c_contig, nb::device::cpu>>(),
+            "vertices"_a, "triangles"_a)
+        .def_static("from_file", &Session::from_file,
+            "filename"_a,
+            "Create a session by loading a mesh file (OBJ or STL) directly\n\n"
+            "Parameters\n"
+            "----------\n"
+            "filename : str\n"
+            "    Path to mesh file (.obj or .stl)")
+        .def("generate_sdf", &Session::generate_sdf,
+            "origin"_a, "dx"_a,
+            "nx"_a, "ny"_a, "nz"_a,
+            "exact_band"_a = 1,
+            "backend"_a = "auto",
+            "num_threads"_a = 0,
+            "out"_a.noconvert() = nb::none(),
+            "dtype"_a = "float32",
+            "method"_a = "fh",
+            "Generate a signed distance field of the session mesh\n\n"
+            "Takes the same grid parameters (and optional out buffer, dtype and\n"
+            "method) as sdfgen.generate_sdf and returns an ndarray of shape\n"
+            "(nx, ny, nz), dtype float32.")
+        .def("generate_slab", &Session::generate_slab,
+            "origin"_a, "dx"_a,
+            "nx"_a, "ny"_a, "nz"_a,
+            "x0"_a, "x1"_a,
+            "out"_a.noconvert(),
+            "exact_band"_a = 1,
+            "backend"_a = "auto",
+            "num_threads"_a = 0,
+            "method"_a = "fh",
+            "Generate grid slices x0 <= i < x1 of the SDF into out\n\n"
+            "Parameters\n"
+            "----------\n"
+            "origin : tuple of float\n"
+            "    Origin (x, y, z) of the full grid in world space\n"
+            "dx : float\n"
+            "    Grid cell spacing\n"
+            "nx, ny, nz : int\n"
+            "    Dimensions of the full grid\n"
+            "x0, x1 : int\n"
+            "    Half-open range of X slices to generate\n"
+            "out : ndarray, shape (x1 - x0, ny, nz), dtype float32\n"
+            "    C-contiguous destination, e.g. sdf[x0:x1] of the full grid\n"
+            "exact_band : int, optional\n"
+            "    Distance band for exact computation (default: 1)\n"
+            "backend : str, optional\n"
+            "    Hardware backend: 'auto', 'cpu', or 'gpu' (default: 'auto')\n"
+            "num_threads : int, optional\n"
+            "    Number of CPU threads, 0 for auto-detect (default: 0)\n"
+            "method : str, optional\n"
+            "    Far-field method, 'fh' or 'sweep' (default: 'fh')")
+        .def("reorder", &Session::reorder,
+            "Reorder the session mesh for spatial locality\n\n"
+            "Sorts triangles along a Morton curve of their centroids and\n"
+            "renumbers vertices in order of first use, so that consecutive\n"
+            "triangles touch neighbouring grid cells. Signs and cells within dx\n"
+            "of the surface are unchanged. Farther out, both far-field methods\n"
+            "depend on the order in which equidistant triangles are found, so\n"
+            "values can move by a small fraction of dx (up to about 0.15 dx with\n"
+            "method='fh').")
+        .def("close", &Session::close,
+            "Release the mesh buffers held by the session")
+        .def("__enter__", [](Session& s) -> Session& { return s; },
+            nb::rv_policy::reference)
+        .def("__exit__", [](Session& s, nb::args) { s.close(); })
+        .def_prop_ro("bounds", &Session::bounds,
+            "Mesh bounds ((min_x, min_y, min_z), (max_x, max_y, max_z))")
+        .def_prop_ro("num_vertices", &Session::num_vertices)
+        .def_prop_ro("num_triangles", &Session::num_triangles);
+
     m.def("save_sdf", &save_sdf,
         "filename"_a, "sdf_array"_a, "origin"_a, "dx"_a,
+        "dtype"_a = "float32",
+        "compress"_a = nb::none(),
         "Save SDF to binary file\n\n"
         "Parameters\n"
         "----------\n"
@@ -378,7 +895,34 @@ NB_MODULE(sdfgen_ext, m) {
         "origin : tuple of float\n"
         "    Grid origin (x, y, z)\n"
         "dx : float\n"
-        "    Grid cell spacing"
+        "    Grid cell spacing\n"
+        "dtype : str, optional\n"
+        "    Stored value type: 'float32' (legacy format), 'float16' or 'uint8'\n"
+        "    (quantized over the grid's value range). load_sdf expands either\n"
+        "    back to float32 (default: 'float32')\n"
+        "compress : str or None, optional\n"
+        "    'zstd' to store the values as one zstd frame, if SDFGen was built\n"
+        "    with zstd (see is_zstd_available). Compressed files cannot be\n"
+        "    memory-mapped (default: None)"
+    );
+
+    m.def("quantize_sdf", &quantize,
+        "sdf_array"_a, "dtype"_a = "uint8",
+        "Quantize an SDF to a narrower dtype\n\n"
+        "Parameters\n"
+        "----------\n"
+        "sdf_array : ndarray, dtype float32\n"
+        "    Signed distance field (any shape)\n"
+        "dtype : str, optional\n"
+        "    'float16' or 'uint8' (default: 'uint8')\n\n"
+        "Returns\n"
+        "-------\n"
+        "quantized : ndarray, same shape, dtype float16 or uint8\n"
+        "    Stored values\n"
+        "scale : float\n"
+        "    Scale such that sdf ~= quantized * scale + offset\n"
+        "offset : float\n"
+        "    Offset (the grid minimum for uint8, 0 for float16)"
     );
 
     m.def("load_sdf", &load_sdf,
@@ -400,6 +944,21 @@ NB_MODULE(sdfgen_ext, m) {
         "    ((min_x, min_y, min_z), (max_x, max_y, max_z))"
     );
 
+    m.def("read_sdf_header", &read_sdf_header,
+        "filename"_a,
+        "Read the header of an SDF file without loading its values\n\n"
+        "Parameters\n"
+        "----------\n"
+        "filename : str\n"
+        "    Input file path (.sdf)\n\n"
+        "Returns\n"
+        "-------\n"
+        "header : dict\n"
+        "    Keys: shape, origin, dx, bounds, dtype ('float32', 'float16' or\n"
+        "    'uint8'), scale, offset, compression (None or 'zstd') and\n"
+        "    data_offset (byte offset of the values in the file)"
+    );
+
     // Utility functions
     m.def("is_gpu_available", &is_gpu_available,
         "Check if GPU acceleration (CUDA) is available\n\n"
@@ -408,4 +967,12 @@ NB_MODULE(sdfgen_ext, m) {
         "bool\n"
         "    True if GPU is available, False otherwise"
     );
+
+    m.def("is_zstd_available", &is_zstd_available,
+        "Check if zstd-compressed SDF files are supported\n\n"
+        "Returns\n"
+        "-------\n"
+        "bool\n"
+        "    True if SDFGen was built with zstd, False otherwise"
+    );
 }
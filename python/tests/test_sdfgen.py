@@ -6,6 +6,8 @@ import pytest
 import numpy as np
 import os
 import tempfile
+import warnings
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import sdfgen
@@ -58,6 +60,36 @@ def simple_cube():
     return vertices, triangles
 
 
+@pytest.fixture
+def torus():
+    """Create a torus mesh, fine enough that most cells are far from any vertex."""
+    nu, nv = 48, 24
+    u, v = np.meshgrid(
+        np.linspace(0, 2 * np.pi, nu, endpoint=False),
+        np.linspace(0, 2 * np.pi, nv, endpoint=False),
+        indexing="ij",
+    )
+    ring = 1.0 + 0.35 * np.cos(v)
+    vertices = np.stack(
+        [ring * np.cos(u), ring * np.sin(u), 0.35 * np.sin(v)], axis=-1
+    ).reshape(-1, 3).astype(np.float32)
+
+    # Two triangles per quad of the (u, v) parameter grid
+    a = np.arange(nu)[:, None] * nv
+    b = np.arange(nv)[None, :]
+    a1 = (a + nv) % (nu * nv)
+    b1 = (b + 1) % nv
+    quads = [a + b, a1 + b, a1 + b1, a + b1]
+    triangles = np.concatenate(
+        [
+            np.stack([quads[0], quads[1], quads[2]], axis=-1).reshape(-1, 3),
+            np.stack([quads[0], quads[2], quads[3]], axis=-1).reshape(-1, 3),
+        ]
+    ).astype(np.uint32)
+
+    return vertices, triangles
+
+
 @pytest.fixture
 def temp_obj_file(simple_cube):
     """Create a temporary OBJ file."""
@@ -145,6 +177,43 @@ class TestBasicFunctionality:
         assert len(min_box) == 3
         assert len(max_box) == 3
 
+    def test_load_mesh_negative_indices(self, tmp_path):
+        """Test that negative OBJ face indices count back from the latest vertex."""
+        path = tmp_path / "relative.obj"
+        path.write_text(
+            "v 0 0 0\nv 1 0 0\nv 0 1 0\n"
+            "f -3 -2 -1\n"
+            "v +0 0 1.5e0\n"
+            "f 1/1 -3/2 -1/3\n"
+            "f -4 4 -2\n"
+        )
+
+        vertices, triangles, _ = sdfgen.load_mesh(str(path))
+
+        np.testing.assert_array_equal(vertices[3], [0.0, 0.0, 1.5])
+        np.testing.assert_array_equal(triangles, [[0, 1, 2], [0, 1, 3], [0, 3, 2]])
+
+        # An index before the first vertex is a malformed face
+        path.write_text("v 0 0 0\nv 1 0 0\nv 0 1 0\nf -4 -2 -1\n")
+        with pytest.raises(RuntimeError):
+            sdfgen.load_mesh(str(path))
+
+    def test_compute_bounds(self, simple_cube):
+        """Test that compute_bounds matches NumPy min/max reductions."""
+        vertices, _ = simple_cube
+        rng = np.random.default_rng(0)
+        vertices = np.vstack([vertices, rng.uniform(-3, 2, (1000, 3))]).astype(np.float32)
+
+        min_box, max_box = sdfgen.compute_bounds(vertices)
+
+        np.testing.assert_array_equal(min_box, vertices.min(axis=0))
+        np.testing.assert_array_equal(max_box, vertices.max(axis=0))
+
+    def test_compute_bounds_empty(self):
+        """Test that compute_bounds rejects an empty vertex array."""
+        with pytest.raises(ValueError):
+            sdfgen.compute_bounds(np.zeros((0, 3), dtype=np.float32))
+
     def test_generate_from_file(self, temp_obj_file):
         """Test high-level API: generate_from_file."""
         sdf, metadata = sdfgen.generate_from_file(temp_obj_file, nx=32, padding=2)
@@ -205,6 +274,139 @@ class TestBasicFunctionality:
         assert np.allclose(loaded_sdf, sdf)
         assert loaded_dx == pytest.approx(0.1)
 
+    @pytest.mark.parametrize("dtype, itemsize", [("float16", 2), ("uint8", 1)])
+    def test_save_and_load_quantized_sdf(self, simple_cube, temp_sdf_file, dtype, itemsize):
+        """Test that quantized SDF files are smaller and load back as float32."""
+        vertices, triangles = simple_cube
+        sdf = sdfgen.generate_sdf(
+            vertices, triangles, origin=(-0.2, -0.2, -0.2), dx=0.1, nx=14, ny=14, nz=14
+        )
+
+        sdfgen.save_sdf(temp_sdf_file, sdf, origin=(-0.2, -0.2, -0.2), dx=0.1, dtype=dtype)
+        assert os.path.getsize(temp_sdf_file) == 64 + sdf.size * itemsize
+
+        loaded_sdf, loaded_origin, loaded_dx, _ = sdfgen.load_sdf(temp_sdf_file)
+        assert loaded_sdf.dtype == np.float32
+        assert loaded_origin == pytest.approx((-0.2, -0.2, -0.2))
+        assert loaded_dx == pytest.approx(0.1)
+
+        _, scale, _ = sdfgen.quantize_sdf(sdf, dtype)
+        tolerance = scale / 2 if dtype == "uint8" else 1e-3
+        np.testing.assert_allclose(loaded_sdf, sdf, atol=tolerance + 1e-6)
+
+    def test_load_sdf_memmap(self, simple_cube, temp_sdf_file):
+        """Test that float32 files are memory-mapped copy-on-write."""
+        vertices, triangles = simple_cube
+        sdf = sdfgen.generate_sdf(
+            vertices, triangles, origin=(0.0, 0.0, 0.0), dx=0.1, nx=10, ny=11, nz=12
+        )
+        sdfgen.save_sdf(temp_sdf_file, sdf, origin=(0.0, 0.0, 0.0), dx=0.1)
+
+        mapped, origin, dx, bounds = sdfgen.load_sdf(temp_sdf_file)
+        assert isinstance(mapped, np.memmap)
+        np.testing.assert_array_equal(mapped, sdf)
+
+        # Writes stay in memory
+        mapped[0, 0, 0] = 123.0
+        loaded, loaded_origin, loaded_dx, loaded_bounds = sdfgen.load_sdf(
+            temp_sdf_file, mmap=False
+        )
+        assert not isinstance(loaded, np.memmap)
+        np.testing.assert_array_equal(loaded, sdf)
+        assert (loaded_origin, loaded_dx, loaded_bounds) == (origin, dx, bounds)
+        del mapped
+
+    def test_read_sdf_header(self, simple_cube, temp_sdf_file):
+        """Test reading SDF file headers in both formats."""
+        vertices, triangles = simple_cube
+        sdf = sdfgen.generate_sdf(
+            vertices, triangles, origin=(0.5, 0.0, 0.0), dx=0.1, nx=10, ny=11, nz=12
+        )
+
+        sdfgen.save_sdf(temp_sdf_file, sdf, origin=(0.5, 0.0, 0.0), dx=0.1)
+        header = sdfgen.read_sdf_header(temp_sdf_file)
+        assert header["shape"] == (10, 11, 12)
+        assert header["origin"] == pytest.approx((0.5, 0.0, 0.0))
+        assert header["dx"] == pytest.approx(0.1)
+        assert header["dtype"] == "float32"
+        assert header["compression"] is None
+        assert header["data_offset"] == 36
+
+        sdfgen.save_sdf(temp_sdf_file, sdf, origin=(0.5, 0.0, 0.0), dx=0.1, dtype="uint8")
+        header = sdfgen.read_sdf_header(temp_sdf_file)
+        assert header["dtype"] == "uint8"
+        assert header["data_offset"] == 64
+        assert header["offset"] == pytest.approx(sdf.min())
+
+    @pytest.mark.skipif(not sdfgen.is_zstd_available(), reason="Built without zstd")
+    @pytest.mark.parametrize("dtype", ["float32", "float16", "uint8"])
+    def test_save_and_load_compressed_sdf(self, simple_cube, temp_sdf_file, dtype):
+        """Test zstd-compressed SDF files."""
+        vertices, triangles = simple_cube
+        sdf = sdfgen.generate_sdf(
+            vertices, triangles, origin=(-0.2, -0.2, -0.2), dx=0.05, nx=28, ny=28, nz=28
+        )
+
+        sdfgen.save_sdf(temp_sdf_file, sdf, (-0.2, -0.2, -0.2), 0.05, dtype=dtype)
+        expected, _, _, _ = sdfgen.load_sdf(temp_sdf_file, mmap=False)
+        uncompressed_size = os.path.getsize(temp_sdf_file)
+
+        sdfgen.save_sdf(temp_sdf_file, sdf, (-0.2, -0.2, -0.2), 0.05, dtype=dtype, compress="zstd")
+        assert os.path.getsize(temp_sdf_file) < uncompressed_size
+        assert sdfgen.read_sdf_header(temp_sdf_file)["compression"] == "zstd"
+
+        loaded, _, dx, _ = sdfgen.load_sdf(temp_sdf_file)
+        assert not isinstance(loaded, np.memmap)
+        assert dx == pytest.approx(0.05)
+        np.testing.assert_array_equal(loaded, expected)
+
+    def test_save_sdf_invalid_compression(self, simple_cube, temp_sdf_file):
+        """Test that unknown compression names are rejected."""
+        sdf = np.zeros((4, 4, 4), dtype=np.float32)
+
+        with pytest.raises(ValueError):
+            sdfgen.save_sdf(temp_sdf_file, sdf, (0.0, 0.0, 0.0), 0.1, compress="lz4")
+
+    def test_quantize_sdf(self, simple_cube):
+        """Test float16 and uint8 quantization of an SDF grid."""
+        vertices, triangles = simple_cube
+        sdf = sdfgen.generate_sdf(
+            vertices, triangles, origin=(-0.2, -0.2, -0.2), dx=0.1, nx=14, ny=14, nz=14
+        )
+
+        half, scale, offset = sdfgen.quantize_sdf(sdf, "float16")
+        assert half.dtype == np.float16 and half.shape == sdf.shape
+        assert (scale, offset) == (1.0, 0.0)
+        np.testing.assert_array_equal(half, sdf.astype(np.float16))
+
+        q, scale, offset = sdfgen.quantize_sdf(sdf, "uint8")
+        assert q.dtype == np.uint8 and q.shape == sdf.shape
+        assert offset == pytest.approx(sdf.min())
+        assert q.max() == 255
+        np.testing.assert_allclose(q * scale + offset, sdf, atol=scale / 2 + 1e-6)
+
+        with pytest.raises(ValueError):
+            sdfgen.quantize_sdf(sdf, "int16")
+
+    def test_generate_sdf_float16(self, simple_cube):
+        """Test generating a float16 SDF directly."""
+        vertices, triangles = simple_cube
+        grid = {"origin": (-0.2, -0.2, -0.2), "dx": 0.1, "nx": 14, "ny": 15, "nz": 16}
+
+        sdf = sdfgen.generate_sdf(vertices, triangles, **grid)
+        half = sdfgen.generate_sdf(vertices, triangles, dtype="float16", **grid)
+
+        assert half.dtype == np.float16
+        np.testing.assert_array_equal(half, sdf.astype(np.float16))
+
+        with pytest.raises(ValueError):
+            sdfgen.generate_sdf(vertices, triangles, dtype="uint8", **grid)
+
+        with pytest.raises(ValueError):
+            sdfgen.generate_sdf(
+                vertices, triangles, dtype="float16", out=np.empty((14, 15, 16), np.float32), **grid
+            )
+
 
 # Backend tests
 class TestBackends:
@@ -392,6 +594,66 @@ class TestParameters:
             )
             assert sdf.shape == (10, 10, 10)
 
+    def test_out_parameter(self, simple_cube):
+        """Test writing the SDF into a preallocated buffer."""
+        vertices, triangles = simple_cube
+        grid = {
+            "origin": (-0.5, -0.5, -0.5), "dx": 0.1, "nx": 20, "ny": 21, "nz": 22, "backend": "cpu"
+        }
+
+        expected = sdfgen.generate_sdf(vertices, triangles, **grid)
+        out = np.full((20, 21, 22), np.nan, dtype=np.float32)
+        sdf = sdfgen.generate_sdf(vertices, triangles, out=out, **grid)
+
+        assert np.shares_memory(sdf, out)
+        np.testing.assert_array_equal(out, expected)
+
+    def test_out_parameter_invalid(self, simple_cube):
+        """Test that mismatched output buffers are rejected."""
+        vertices, triangles = simple_cube
+        grid = {"origin": (0.0, 0.0, 0.0), "dx": 0.1, "nx": 10, "ny": 10, "nz": 10}
+
+        with pytest.raises(ValueError):
+            sdfgen.generate_sdf(
+                vertices, triangles, out=np.empty((10, 10, 11), dtype=np.float32), **grid
+            )
+
+        # No silent conversion: the result would not land in the caller's buffer
+        with pytest.raises(TypeError):
+            sdfgen.generate_sdf(
+                vertices, triangles, out=np.empty((10, 10, 10), dtype=np.float64), **grid
+            )
+
+    def test_method_parameter(self, simple_cube):
+        """Test that the feature transform and sweeping far fields agree."""
+        vertices, triangles = simple_cube
+        grid = {"origin": (-1.5, -1.5, -1.5), "dx": 0.1, "nx": 31, "ny": 31, "nz": 31}
+
+        sdf_fh = sdfgen.generate_sdf(vertices, triangles, backend="cpu", method="fh", **grid)
+        sdf_sweep = sdfgen.generate_sdf(
+            vertices, triangles, backend="cpu", method="sweep", **grid
+        )
+
+        # Cells next to the surface are exact either way
+        near = np.abs(sdf_sweep) <= grid["dx"]
+        np.testing.assert_array_equal(sdf_fh[near], sdf_sweep[near])
+        np.testing.assert_allclose(sdf_fh, sdf_sweep, atol=0.5 * grid["dx"])
+        assert np.array_equal(np.sign(sdf_fh), np.sign(sdf_sweep))
+
+        with pytest.raises(ValueError):
+            sdfgen.generate_sdf(vertices, triangles, method="exact", **grid)
+
+    def test_tiny_mesh_is_exact(self):
+        """Test that a mesh of a few triangles gets exact distances everywhere."""
+        vertices = np.array([[0, 0, 0], [1, 0, 0], [0, 1, 0]], dtype=np.float32)
+        triangles = np.array([[0, 1, 2]], dtype=np.uint32)
+        grid = {"origin": (-0.5, -0.5, -0.5), "dx": 0.07, "nx": 30, "ny": 30, "nz": 30}
+
+        sdf = sdfgen.generate_sdf(vertices, triangles, backend="cpu", **grid)
+        exact = sdfgen.generate_sdf(vertices, triangles, backend="cpu", exact_band=30, **grid)
+
+        np.testing.assert_allclose(sdf, exact, rtol=1e-6)
+
 
 # Error handling tests
 class TestErrorHandling:
@@ -442,6 +704,34 @@ class TestErrorHandling:
                 nz=10,
             )
 
+    def test_triangle_index_out_of_range(self, simple_cube):
+        """Test that triangle indices past the vertex array are rejected."""
+        vertices, triangles = simple_cube
+        bad_triangles = triangles.copy()
+        bad_triangles[5, 1] = len(vertices)
+
+        with pytest.raises(ValueError, match="out of range"):
+            sdfgen.generate_sdf(
+                vertices, bad_triangles, origin=(0.0, 0.0, 0.0), dx=0.1, nx=10, ny=10, nz=10
+            )
+
+        with pytest.raises(ValueError):
+            sdfgen.Session(vertices, bad_triangles)
+
+        with pytest.raises(ValueError):
+            sdfgen.generate_from_mesh(vertices, bad_triangles, nx=10)
+
+    def test_triangle_index_out_of_range_in_file(self, tmp_path):
+        """Test that files with face indices past the vertex list are rejected."""
+        path = tmp_path / "bad.obj"
+        path.write_text("v 0 0 0\nv 1 0 0\nv 0 1 0\nf 1 2 40000000\n")
+
+        with pytest.raises(ValueError, match="out of range"):
+            sdfgen.Session.from_file(str(path))
+
+        with pytest.raises(ValueError, match="out of range"):
+            sdfgen.generate_from_file(str(path), nx=10)
+
 
 # Property tests
 class TestSDFProperties:
@@ -540,6 +830,16 @@ class TestCriticalErrorHandling:
         with pytest.raises(Exception):
             sdfgen.load_sdf("nonexistent_file_xyz.sdf")
 
+    def test_load_sdf_truncated_file(self, temp_sdf_file):
+        """Test that load_sdf fails when the data is shorter than the header says."""
+        sdfgen.save_sdf(temp_sdf_file, np.zeros((8, 8, 8), dtype=np.float32), (0.0, 0.0, 0.0), 0.1)
+        with open(temp_sdf_file, "r+b") as f:
+            f.truncate(36 + 100)
+
+        for mmap in (True, False):
+            with pytest.raises(RuntimeError):
+                sdfgen.load_sdf(temp_sdf_file, mmap=mmap)
+
     def test_load_sdf_corrupted_file(self):
         """Test that load_sdf fails with corrupted file."""
         with tempfile.NamedTemporaryFile(mode="wb", suffix=".sdf", delete=False) as f:
@@ -755,6 +1055,453 @@ class TestHighLevelAPIParameters:
         assert sdf.dtype == np.float32
 
 
+    def test_generate_from_mesh_with_bounds(self, simple_cube):
+        """Test that passing known bounds gives the same result as computing them."""
+        vertices, triangles = simple_cube
+        bounds = sdfgen.compute_bounds(vertices)
+
+        sdf_ref, meta_ref = sdfgen.generate_from_mesh(
+            vertices, triangles, nx=16, backend="cpu"
+        )
+        sdf, meta = sdfgen.generate_from_mesh(
+            vertices, triangles, nx=16, backend="cpu", bounds=bounds
+        )
+
+        np.testing.assert_array_equal(sdf, sdf_ref)
+        assert meta["origin"] == meta_ref["origin"]
+        assert meta["bounds"] == meta_ref["bounds"]
+
+    def test_generate_from_mesh_dx_only(self, simple_cube):
+        """Test generate_from_mesh sizing the grid from dx alone."""
+        vertices, triangles = simple_cube
+
+        sdf, metadata = sdfgen.generate_from_mesh(
+            vertices, triangles, dx=0.1, padding=1, backend="cpu"
+        )
+
+        # 1.0 extent / 0.1 = 10 cells, plus 2 padding cells per axis
+        assert sdf.shape == (12, 12, 12)
+        assert metadata["dx"] == pytest.approx(0.1)
+
+    def test_generate_from_mesh_missing_parameters(self, simple_cube):
+        """Test that generate_from_mesh requires nx or dx."""
+        vertices, triangles = simple_cube
+
+        with pytest.raises(ValueError):
+            sdfgen.generate_from_mesh(vertices, triangles)
+
+    def test_generate_from_mesh_out_parameter(self, simple_cube):
+        """Test reusing one output buffer across generate_from_mesh calls."""
+        vertices, triangles = simple_cube
+        out = np.empty((12, 12, 12), dtype=np.float32)
+
+        for band in (1, 2):
+            expected, _ = sdfgen.generate_from_mesh(
+                vertices, triangles, dx=0.1, exact_band=band, backend="cpu"
+            )
+            sdf, _ = sdfgen.generate_from_mesh(
+                vertices, triangles, dx=0.1, exact_band=band, backend="cpu", out=out
+            )
+            assert np.shares_memory(sdf, out)
+            np.testing.assert_array_equal(out, expected)
+
+        with pytest.raises(ValueError):
+            sdfgen.generate_from_mesh(vertices, triangles, nx=20, out=out)
+
+    def test_generate_from_mesh_uint8(self, simple_cube):
+        """Test that uint8 output carries scale and offset in the metadata."""
+        vertices, triangles = simple_cube
+
+        sdf, _ = sdfgen.generate_from_mesh(vertices, triangles, nx=16, backend="cpu")
+        q, metadata = sdfgen.generate_from_mesh(
+            vertices, triangles, nx=16, backend="cpu", dtype="uint8"
+        )
+
+        assert q.dtype == np.uint8
+        scale, offset = metadata["scale"], metadata["offset"]
+        np.testing.assert_allclose(q * scale + offset, sdf, atol=scale / 2 + 1e-6)
+
+    def test_generate_from_mesh_reorder(self, simple_cube):
+        """Test that reordering a shuffled mesh gives the same SDF."""
+        vertices, triangles = simple_cube
+        rng = np.random.default_rng(0)
+        vertex_order = rng.permutation(len(vertices))
+        shuffled_vertices = vertices[vertex_order]
+        shuffled_triangles = np.argsort(vertex_order).astype(np.uint32)[
+            triangles[rng.permutation(len(triangles))]
+        ]
+
+        sdf_plain, meta_plain = sdfgen.generate_from_mesh(
+            shuffled_vertices, shuffled_triangles, nx=24, backend="cpu"
+        )
+        sdf_reordered, meta_reordered = sdfgen.generate_from_mesh(
+            shuffled_vertices, shuffled_triangles, nx=24, backend="cpu", reorder=True
+        )
+
+        assert meta_reordered["bounds"] == meta_plain["bounds"]
+        np.testing.assert_allclose(sdf_reordered, sdf_plain, atol=1e-5)
+
+    @pytest.mark.parametrize("method", ["fh", "sweep"])
+    def test_generate_from_mesh_reorder_far_field(self, torus, method):
+        """Test how far reordering a finer mesh moves the approximate far field."""
+        vertices, triangles = torus
+        rng = np.random.default_rng(0)
+        vertex_order = rng.permutation(len(vertices))
+        shuffled_vertices = vertices[vertex_order]
+        shuffled_triangles = np.argsort(vertex_order).astype(np.uint32)[
+            triangles[rng.permutation(len(triangles))]
+        ]
+
+        sdf_plain, meta = sdfgen.generate_from_mesh(
+            shuffled_vertices, shuffled_triangles, nx=48, backend="cpu", method=method
+        )
+        sdf_reordered, _ = sdfgen.generate_from_mesh(
+            shuffled_vertices, shuffled_triangles, nx=48, backend="cpu", method=method,
+            reorder=True,
+        )
+
+        # Exact near the surface; farther out, equidistant triangles are found in another
+        # order, which moves the far field by a fraction of a cell
+        near = np.abs(sdf_plain) <= meta["dx"]
+        np.testing.assert_allclose(sdf_reordered[near], sdf_plain[near], atol=1e-6)
+        np.testing.assert_allclose(sdf_reordered, sdf_plain, atol=0.25 * meta["dx"])
+        assert np.array_equal(np.sign(sdf_reordered), np.sign(sdf_plain))
+
+    def test_generate_batch(self, temp_obj_file, simple_cube):
+        """Test that generate_batch matches per-file generate_from_file calls."""
+        vertices, triangles = simple_cube
+
+        # A second, larger mesh so the results differ per file
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".obj", delete=False) as f:
+            for v in vertices * 2.0:
+                f.write(f"v {v[0]} {v[1]} {v[2]}\n")
+            for t in triangles:
+                f.write(f"f {t[0]+1} {t[1]+1} {t[2]+1}\n")
+            other_file = f.name
+
+        try:
+            files = [temp_obj_file, other_file, temp_obj_file]
+            results = sdfgen.generate_batch(files, dx=0.1, backend="cpu", workers=3)
+
+            assert len(results) == len(files)
+            for filename, (sdf, metadata) in zip(files, results):
+                expected, expected_meta = sdfgen.generate_from_file(
+                    filename, dx=0.1, backend="cpu"
+                )
+                np.testing.assert_array_equal(sdf, expected)
+                assert metadata["bounds"] == expected_meta["bounds"]
+
+            assert results[1][0].shape != results[0][0].shape
+        finally:
+            os.unlink(other_file)
+
+        assert sdfgen.generate_batch([], nx=16) == []
+
+        with pytest.raises(ValueError):
+            sdfgen.generate_batch([temp_obj_file])
+
+        with pytest.raises(ValueError):
+            sdfgen.generate_batch([temp_obj_file], nx=16, workers=-1)
+
+        with pytest.raises(OSError):
+            sdfgen.generate_batch(["nonexistent_file.obj"], nx=16)
+
+    def test_cache_dir(self, temp_obj_file):
+        """Test that cached results match fresh generation."""
+        expected, expected_meta = sdfgen.generate_from_file(temp_obj_file, nx=20, backend="cpu")
+        expected_u8, expected_u8_meta = sdfgen.generate_from_file(
+            temp_obj_file, nx=20, backend="cpu", dtype="uint8"
+        )
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            # First call fills the cache, second one reads it back
+            for _ in range(2):
+                sdf, metadata = sdfgen.generate_from_file(
+                    temp_obj_file, nx=20, backend="cpu", cache_dir=cache_dir
+                )
+                np.testing.assert_array_equal(sdf, expected)
+                assert metadata["origin"] == expected_meta["origin"]
+                assert metadata["dx"] == expected_meta["dx"]
+                assert metadata["bounds"] == expected_meta["bounds"]
+            assert len(os.listdir(cache_dir)) == 2
+            del sdf  # release the memory map before the directory is removed
+
+            sdf, metadata = sdfgen.generate_from_file(
+                temp_obj_file, nx=20, backend="cpu", cache_dir=cache_dir, dtype="uint8"
+            )
+            np.testing.assert_array_equal(sdf, expected_u8)
+            assert metadata["scale"] == expected_u8_meta["scale"]
+
+            # Different parameters are a different entry
+            sdf, _ = sdfgen.generate_from_file(
+                temp_obj_file, nx=24, backend="cpu", cache_dir=cache_dir
+            )
+            assert sdf.shape != expected.shape
+            assert len(os.listdir(cache_dir)) == 4
+            del sdf
+
+    def test_cache_dir_damaged_entry(self, temp_obj_file):
+        """Test that an entry with a missing or truncated SDF is regenerated."""
+        expected, _ = sdfgen.generate_from_file(temp_obj_file, nx=20, backend="cpu")
+
+        with tempfile.TemporaryDirectory() as cache_dir:
+            sdfgen.generate_from_file(temp_obj_file, nx=20, backend="cpu", cache_dir=cache_dir)
+            (name,) = [n for n in os.listdir(cache_dir) if n.endswith(".sdf")]
+            path = os.path.join(cache_dir, name)
+
+            with open(path, "r+b") as f:
+                f.truncate(os.path.getsize(path) // 2)
+            sdf, _ = sdfgen.generate_from_file(
+                temp_obj_file, nx=20, backend="cpu", cache_dir=cache_dir
+            )
+            np.testing.assert_array_equal(sdf, expected)
+            del sdf
+
+            os.remove(path)
+            sdf, _ = sdfgen.generate_from_file(
+                temp_obj_file, nx=20, backend="cpu", cache_dir=cache_dir
+            )
+            np.testing.assert_array_equal(sdf, expected)
+            assert sorted(os.listdir(cache_dir)) == sorted([name, name[:-4] + ".json"])
+            del sdf
+
+    def test_cache_dir_numpy_scalars(self, temp_obj_file):
+        """Test that NumPy scalar parameters work with the cache."""
+        with tempfile.TemporaryDirectory() as cache_dir:
+            for _ in range(2):
+                sdf, metadata = sdfgen.generate_from_file(
+                    temp_obj_file, nx=np.int64(16), backend="cpu", cache_dir=cache_dir
+                )
+                assert type(metadata["dx"]) is float
+                del sdf
+
+            for _ in range(2):
+                sdf, metadata = sdfgen.generate_from_file(
+                    temp_obj_file, dx=np.float32(0.1), backend="cpu", cache_dir=cache_dir
+                )
+                assert type(metadata["dx"]) is float
+                del sdf
+            assert len(os.listdir(cache_dir)) == 4
+
+
+class TestChunkedGeneration:
+    """
+    Test slab-by-slab SDF generation.
+
+    Tests cover:
+    - Chunked output matching single-call generate_sdf
+    - Writing into caller-provided (memory-mapped) buffers
+    - Session reuse and context-manager lifetime
+    - Parameter validation
+    """
+
+    @pytest.mark.parametrize("chunk_size", [1, 3, 7, 64])
+    def test_chunked_matches_full_grid(self, simple_cube, chunk_size):
+        """Test that chunked generation reproduces the full-grid SDF."""
+        vertices, triangles = simple_cube
+        grid = {"origin": (-0.93, -1.02, -0.97), "dx": 0.1, "nx": 20, "ny": 22, "nz": 24}
+
+        sdf_full = sdfgen.generate_sdf(vertices, triangles, backend="cpu", **grid)
+        sdf_chunked = sdfgen.generate_sdf_chunked(
+            vertices, triangles, chunk_size=chunk_size, backend="cpu", **grid
+        )
+
+        assert sdf_chunked.shape == sdf_full.shape
+        assert sdf_chunked.dtype == np.float32
+        np.testing.assert_allclose(sdf_chunked, sdf_full, atol=1e-5)
+
+    @pytest.mark.parametrize("method", ["fh", "sweep"])
+    @pytest.mark.parametrize("chunk_size", [1, 3, 7])
+    def test_chunked_matches_full_grid_fine_mesh(self, torus, method, chunk_size):
+        """Test that slabs of a finer mesh reproduce the full grid's far field."""
+        vertices, triangles = torus
+        grid = {"origin": (-1.45, -1.45, -0.45), "dx": 0.08, "nx": 37, "ny": 37, "nz": 12}
+
+        sdf_full = sdfgen.generate_sdf(vertices, triangles, backend="cpu", method=method, **grid)
+        sdf_chunked = sdfgen.generate_sdf_chunked(
+            vertices, triangles, chunk_size=chunk_size, backend="cpu", method=method, **grid
+        )
+
+        if method == "fh":
+            # The feature transform sees the full grid's seeds from every slab
+            np.testing.assert_array_equal(sdf_chunked, sdf_full)
+        else:
+            np.testing.assert_allclose(sdf_chunked, sdf_full, atol=0.1 * grid["dx"])
+        assert np.array_equal(np.sign(sdf_chunked), np.sign(sdf_full))
+
+    def test_chunked_into_memmap(self, simple_cube, tmp_path):
+        """Test that chunked generation writes into a memory-mapped output."""
+        vertices, triangles = simple_cube
+        grid = {"origin": (-1.0, -1.0, -1.0), "dx": 0.1, "nx": 20, "ny": 20, "nz": 20}
+
+        out = np.lib.format.open_memmap(
+            tmp_path / "sdf.npy", mode="w+", dtype=np.float32, shape=(20, 20, 20)
+        )
+        result = sdfgen.generate_sdf_chunked(
+            vertices, triangles, chunk_size=8, out=out, backend="cpu", **grid
+        )
+        out.flush()
+
+        assert result is out
+        sdf_full = sdfgen.generate_sdf(vertices, triangles, backend="cpu", **grid)
+        np.testing.assert_allclose(np.load(tmp_path / "sdf.npy"), sdf_full, atol=1e-5)
+
+    def test_chunked_invalid_parameters(self, simple_cube):
+        """Test that chunked generation validates chunk size and output shape."""
+        vertices, triangles = simple_cube
+        grid = {"origin": (-1.0, -1.0, -1.0), "dx": 0.1, "nx": 10, "ny": 10, "nz": 10}
+
+        with pytest.raises(ValueError):
+            sdfgen.generate_sdf_chunked(vertices, triangles, chunk_size=0, **grid)
+
+        with pytest.raises(ValueError):
+            sdfgen.generate_sdf_chunked(
+                vertices, triangles, out=np.empty((10, 10, 9), dtype=np.float32), **grid
+            )
+
+    def test_session_generate_slab(self, simple_cube):
+        """Test generating individual slabs through a Session."""
+        vertices, triangles = simple_cube
+        sdf_full = sdfgen.generate_sdf(
+            vertices, triangles, origin=(-1.0, -1.0, -1.0), dx=0.1,
+            nx=20, ny=20, nz=20, backend="cpu"
+        )
+
+        out = np.empty((20, 20, 20), dtype=np.float32)
+        with sdfgen.Session(vertices, triangles) as session:
+            assert session.num_vertices == len(vertices)
+            assert session.num_triangles == len(triangles)
+            origin = (-1.0, -1.0, -1.0)
+            session.generate_slab(origin, 0.1, 20, 20, 20, 0, 12, out[:12], backend="cpu")
+            session.generate_slab(origin, 0.1, 20, 20, 20, 12, 20, out[12:], backend="cpu")
+
+        np.testing.assert_allclose(out, sdf_full, atol=1e-5)
+
+        # Leaving the context releases the mesh
+        with pytest.raises(RuntimeError):
+            session.generate_slab((-1.0, -1.0, -1.0), 0.1, 20, 20, 20, 0, 20, out)
+
+    def test_session_generate_slab_huge_grid(self, torus):
+        """Test a slab of a grid with more cells than an int can index."""
+        vertices, triangles = torus
+        origin = (-1.45, -1.45, -1.45)
+
+        # The slab is the same, and nearer to the mesh than the end of either grid
+        slabs = []
+        with sdfgen.Session(vertices, triangles) as session:
+            for nx in (70, 2_000_000):
+                out = np.empty((16, 64, 64), dtype=np.float32)
+                session.generate_slab(origin, 0.045, nx, 64, 64, 20, 36, out, backend="cpu")
+                slabs.append(out)
+
+        np.testing.assert_array_equal(slabs[1], slabs[0])
+
+    def test_session_generate_sdf(self, simple_cube):
+        """Test that a Session reused across resolutions matches generate_sdf."""
+        vertices, triangles = simple_cube
+
+        with sdfgen.Session(vertices, triangles) as session:
+            min_box, max_box = session.bounds
+            np.testing.assert_array_equal(min_box, vertices.min(axis=0))
+            np.testing.assert_array_equal(max_box, vertices.max(axis=0))
+
+            for n in (8, 16, 24):
+                dx = 2.0 / n
+                sdf = session.generate_sdf((-1.0, -1.0, -1.0), dx, n, n, n, backend="cpu")
+                sdf_ref = sdfgen.generate_sdf(
+                    vertices, triangles, origin=(-1.0, -1.0, -1.0), dx=dx,
+                    nx=n, ny=n, nz=n, backend="cpu"
+                )
+                np.testing.assert_array_equal(sdf, sdf_ref)
+
+    def test_session_from_file(self, temp_obj_file):
+        """Test creating a Session directly from a mesh file."""
+        vertices, triangles, bounds = sdfgen.load_mesh(temp_obj_file)
+        session = sdfgen.Session.from_file(temp_obj_file)
+
+        assert session.num_vertices == len(vertices)
+        assert session.num_triangles == len(triangles)
+        assert session.bounds == bounds
+
+        with pytest.raises(RuntimeError):
+            sdfgen.Session.from_file("nonexistent_file.obj")
+
+    def test_generate_from_file_reuses_loaded_mesh(self, temp_obj_file):
+        """Test that repeated generate_from_file calls reuse the loaded mesh."""
+        sdfgen._cached_session.cache_clear()
+
+        sdf_a, _ = sdfgen.generate_from_file(temp_obj_file, nx=16, backend="cpu")
+        sdfgen.generate_from_file(temp_obj_file, nx=24, backend="cpu")
+        assert sdfgen._cached_session.cache_info().hits == 1
+
+        # Modifying the file invalidates the cached mesh
+        with open(temp_obj_file, "a") as f:
+            f.write("v 0.0 0.0 3.0\n")
+        sdf_b, meta_b = sdfgen.generate_from_file(temp_obj_file, nx=16, backend="cpu")
+        assert sdfgen._cached_session.cache_info().hits == 1
+        assert meta_b["bounds"][1][2] == pytest.approx(3.0)
+        assert sdf_b.shape != sdf_a.shape
+
+    def test_session_reorder(self, simple_cube):
+        """Test that Session.reorder keeps the mesh size and bounds."""
+        vertices, triangles = simple_cube
+        # An unreferenced vertex still counts towards the bounds
+        vertices = np.vstack([vertices, [[0.0, 0.0, 5.0]]]).astype(np.float32)
+
+        with sdfgen.Session(vertices, triangles) as session:
+            bounds = session.bounds
+            session.reorder()
+            assert session.num_vertices == len(vertices)
+            assert session.num_triangles == len(triangles)
+
+            session.close()
+            with pytest.raises(RuntimeError):
+                session.reorder()
+
+        with sdfgen.Session(vertices, triangles) as session:
+            session.reorder()
+            assert session.bounds == bounds
+
+    def test_session_concurrent_generation(self, simple_cube):
+        """Test generating from one session on several Python threads."""
+        vertices, triangles = simple_cube
+        origin = (-0.75, -0.75, -0.75)
+
+        with sdfgen.Session(vertices, triangles) as session:
+            expected = session.generate_sdf(origin, 0.1, 15, 15, 15, backend="cpu")
+
+            def generate(_):
+                return session.generate_sdf(
+                    origin, 0.1, 15, 15, 15, backend="cpu", num_threads=1
+                )
+
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                results = list(executor.map(generate, range(8)))
+
+        for sdf in results:
+            np.testing.assert_array_equal(sdf, expected)
+
+    def test_session_invalid_slab(self, simple_cube):
+        """Test that Session rejects bad slab ranges and output buffers."""
+        vertices, triangles = simple_cube
+        session = sdfgen.Session(vertices, triangles)
+        out = np.empty((5, 10, 10), dtype=np.float32)
+
+        with pytest.raises(ValueError):
+            session.generate_slab((0.0, 0.0, 0.0), 0.1, 10, 10, 10, 8, 13, out)
+
+        with pytest.raises(ValueError):
+            session.generate_slab((0.0, 0.0, 0.0), 0.1, 10, 10, 10, 0, 4, out)
+
+        with pytest.raises(TypeError):
+            session.generate_slab(
+                (0.0, 0.0, 0.0), 0.1, 10, 10, 10, 0, 5, out.astype(np.float64)
+            )
+
+        with pytest.raises(ValueError):
+            sdfgen.Session(np.zeros((0, 3), dtype=np.float32), triangles)
+
+
 class TestDataValidation:
     """
     Test data type and shape validation.
@@ -823,6 +1570,31 @@ class TestDataValidation:
             # If it fails, it should mention contiguity
             assert "contiguous" in str(e).lower() or "layout" in str(e).lower()
 
+    def test_generate_from_mesh_coerces_inputs(self, simple_cube):
+        """Test that generate_from_mesh converts mismatched arrays once, with a warning."""
+        vertices, triangles = simple_cube
+        sdf_ref, _ = sdfgen.generate_from_mesh(vertices, triangles, nx=12, backend="cpu")
+
+        with pytest.warns(UserWarning, match="vertices copied"):
+            sdf, _ = sdfgen.generate_from_mesh(
+                vertices.astype(np.float64), triangles, nx=12, backend="cpu"
+            )
+        np.testing.assert_array_equal(sdf, sdf_ref)
+
+        with pytest.warns(UserWarning, match="triangles copied"):
+            sdf, _ = sdfgen.generate_from_mesh(
+                vertices, np.asfortranarray(triangles.astype(np.int64)), nx=12, backend="cpu"
+            )
+        np.testing.assert_array_equal(sdf, sdf_ref)
+
+    def test_generate_from_mesh_no_warning_for_matching_inputs(self, simple_cube):
+        """Test that float32/uint32 C-contiguous inputs are passed through silently."""
+        vertices, triangles = simple_cube
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            sdfgen.generate_from_mesh(vertices, triangles, nx=12, backend="cpu")
+
     def test_generate_sdf_out_of_bounds_indices(self, simple_cube):
         """Test that generate_sdf handles out-of-bounds triangle indices."""
         vertices, triangles = simple_cube